@@ -1,5 +1,7 @@
 import os
+import re
 from logging.config import fileConfig
+from typing import Any
 
 from sqlalchemy import pool, text
 from sqlalchemy.engine import Connection
@@ -24,14 +26,27 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Monthly items partitions (items_pYYYY_MM, items_default) are created at runtime
+# by public.items_ensure_partition, not declared in the metadata — without this,
+# autogenerate would emit DROP TABLE for every live partition.
+_ITEM_PARTITION = re.compile(r"^items_(p\d{4}_\d{2}|default)$")
+
+
+def include_object(_object: Any, name: str | None, type_: str, reflected: bool, _compare_to: Any) -> bool:
+    return not (type_ == "table" and reflected and name is not None and _ITEM_PARTITION.match(name))
+
 
 def run_migrations_for_schema(connection: Connection) -> None:
     connection.execute(text("SET search_path TO public"))
+    # SET is session-scoped; commit the implicit transaction it opened so Alembic
+    # owns the migration transaction (autocommit_block() needs that for CONCURRENTLY).
+    connection.commit()
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
         version_table_schema="public",
         include_schemas=True,
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -55,6 +70,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
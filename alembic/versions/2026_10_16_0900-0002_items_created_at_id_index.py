@@ -0,0 +1,39 @@
+"""add items (created_at, id) index for keyset pagination
+
+Revision ID: 0002_items_keyset_index
+Revises: 0001_initial
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+revision = "0002_items_keyset_index"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so a large items table stays writable while the index builds; it
+    # cannot run inside the migration transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "items_created_at_id_idx",
+            "items",
+            ["created_at", "id"],
+            schema="public",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "items_created_at_id_idx",
+            table_name="items",
+            schema="public",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
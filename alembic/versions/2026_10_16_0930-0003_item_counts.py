@@ -0,0 +1,109 @@
+"""add trigger-maintained item_counts
+
+Revision ID: 0003_item_counts
+Revises: 0002_items_keyset_index
+Create Date: 2026-10-16
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0003_item_counts"
+down_revision = "0002_items_keyset_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "item_counts",
+        sa.Column("status", sa.String(length=20), primary_key=True),
+        sa.Column("shard", sa.SmallInteger(), primary_key=True),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        schema="public",
+    )
+
+    # Statement-level triggers with transition tables: one upsert per statement and
+    # status (a 500-row bulk insert touches item_counts once, not 500 times). The
+    # shard (backend pid mod 16) keeps concurrent writers off a single hot row.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION public.items_count_rows() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                DELETE FROM public.item_counts;
+            ELSIF TG_OP = 'INSERT' THEN
+                INSERT INTO public.item_counts AS c (status, shard, count)
+                SELECT status, mod(pg_backend_pid(), 16), count(*)
+                FROM new_rows GROUP BY status ORDER BY status
+                ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO public.item_counts AS c (status, shard, count)
+                SELECT status, mod(pg_backend_pid(), 16), -count(*)
+                FROM old_rows GROUP BY status ORDER BY status
+                ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count;
+            ELSE
+                INSERT INTO public.item_counts AS c (status, shard, count)
+                SELECT status, mod(pg_backend_pid(), 16), sum(delta)
+                FROM (
+                    SELECT o.status, -1 AS delta FROM old_rows o JOIN new_rows n ON n.id = o.id
+                    WHERE o.status <> n.status
+                    UNION ALL
+                    SELECT n.status, 1 AS delta FROM old_rows o JOIN new_rows n ON n.id = o.id
+                    WHERE o.status <> n.status
+                ) moved
+                GROUP BY status ORDER BY status
+                ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count;
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+
+    # Block writers while the triggers go live and the backfill runs, so no row is
+    # counted twice or missed. Reads are unaffected.
+    op.execute("LOCK TABLE public.items IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(
+        """
+        CREATE TRIGGER items_count_insert AFTER INSERT ON public.items
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER items_count_update AFTER UPDATE ON public.items
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER items_count_delete AFTER DELETE ON public.items
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER items_count_truncate AFTER TRUNCATE ON public.items
+        FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO public.item_counts (status, shard, count)
+        SELECT status, 0, count(*) FROM public.items GROUP BY status
+        """
+    )
+
+
+def downgrade() -> None:
+    for event in ("insert", "update", "delete", "truncate"):
+        op.execute(f"DROP TRIGGER IF EXISTS items_count_{event} ON public.items")
+    op.execute("DROP FUNCTION IF EXISTS public.items_count_rows()")
+    op.drop_table("item_counts", schema="public")
@@ -0,0 +1,45 @@
+"""add per-status partial indexes on items (created_at, id)
+
+Revision ID: 0004_items_status_indexes
+Revises: 0003_item_counts
+Create Date: 2026-10-16
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0004_items_status_indexes"
+down_revision = "0003_item_counts"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of VALID_ITEM_STATUSES at the time of this migration.
+STATUSES = ("active", "archived")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for status in STATUSES:
+            op.create_index(
+                f"items_{status}_created_at_id_idx",
+                "items",
+                ["created_at", "id"],
+                schema="public",
+                postgresql_where=sa.text(f"status = '{status}'"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for status in STATUSES:
+            op.drop_index(
+                f"items_{status}_created_at_id_idx",
+                table_name="items",
+                schema="public",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,56 @@
+"""add generated items.search_vector with a GIN index
+
+Revision ID: 0005_items_search_vector
+Revises: 0004_items_status_indexes
+Create Date: 2026-10-16
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "0005_items_search_vector"
+down_revision = "0004_items_status_indexes"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of ITEM_SEARCH_VECTOR_SQL at the time of this migration.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    # A stored generated column rewrites the table under an ACCESS EXCLUSIVE lock —
+    # schedule this on large installs.
+    op.add_column(
+        "items",
+        sa.Column("search_vector", postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR_SQL, persisted=True)),
+        schema="public",
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "items_search_vector_idx",
+            "items",
+            ["search_vector"],
+            schema="public",
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "items_search_vector_idx",
+            table_name="items",
+            schema="public",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("items", "search_vector", schema="public")
@@ -0,0 +1,165 @@
+"""partition items by created_at (monthly ranges)
+
+Revision ID: 0006_items_partitioned
+Revises: 0005_items_search_vector
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+revision = "0006_items_partitioned"
+down_revision = "0005_items_search_vector"
+branch_labels = None
+depends_on = None
+
+# Frozen copies of ITEM_SEARCH_VECTOR_SQL, VALID_ITEM_STATUSES and the partition
+# function in ITEM_PARTITIONS_DDL at the time of this migration.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'C')"
+)
+STATUSES = ("active", "archived")
+PREMAKE_MONTHS = 3
+
+COLUMNS = "id, name, description, summary, status, created_at, updated_at"
+
+ENSURE_PARTITION_FUNCTION = """
+    CREATE OR REPLACE FUNCTION public.items_ensure_partition(month date) RETURNS text
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        first_day timestamp := date_trunc('month', month::timestamp);
+        partition_name text := 'items_p' || to_char(first_day, 'YYYY_MM');
+    BEGIN
+        -- Bounds are UTC month starts, whatever the session's TimeZone.
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS public.%I PARTITION OF public.items FOR VALUES FROM (%L) TO (%L)',
+            partition_name,
+            first_day AT TIME ZONE 'UTC',
+            (first_day + interval '1 month') AT TIME ZONE 'UTC'
+        );
+        RETURN partition_name;
+    END;
+    $$
+"""
+
+
+def _create_table(partition_by: str) -> None:
+    op.execute(
+        f"""
+        CREATE TABLE public.items (
+            id uuid NOT NULL DEFAULT uuidv7(),
+            name varchar(255) NOT NULL,
+            description text,
+            summary text,
+            status varchar(20) NOT NULL DEFAULT 'active',
+            created_at timestamptz NOT NULL DEFAULT now(),
+            updated_at timestamptz NOT NULL DEFAULT now(),
+            search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED,
+            CONSTRAINT items_status_check CHECK (status IN ('active', 'archived'))
+        ) {partition_by}
+        """
+    )
+
+
+def _create_indexes() -> None:
+    # Plain CREATE INDEX: CONCURRENTLY is not supported on a partitioned table. On
+    # the parent it cascades to every partition, present and future.
+    op.execute("CREATE INDEX items_created_at_id_idx ON public.items (created_at, id)")
+    for status in STATUSES:
+        op.execute(
+            f"CREATE INDEX items_{status}_created_at_id_idx ON public.items (created_at, id) WHERE status = '{status}'"
+        )
+    op.execute("CREATE INDEX items_search_vector_idx ON public.items USING gin (search_vector)")
+
+
+def _create_count_triggers() -> None:
+    # public.items_count_rows() (0003) is unchanged; only the triggers are re-attached.
+    op.execute(
+        """
+        CREATE TRIGGER items_count_insert AFTER INSERT ON public.items
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER items_count_update AFTER UPDATE ON public.items
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER items_count_delete AFTER DELETE ON public.items
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER items_count_truncate AFTER TRUNCATE ON public.items
+        FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+        """
+    )
+
+
+def _set_aside_old_table(new_name: str) -> None:
+    # The old table's indexes and constraints would clash with the new table's names;
+    # it is dropped once its rows are copied (taking its triggers with it).
+    op.execute(f"ALTER TABLE public.items RENAME TO {new_name}")
+    op.execute(f"ALTER INDEX public.items_pkey RENAME TO {new_name}_pkey")
+    for index in (
+        "items_created_at_id_idx",
+        *(f"items_{status}_created_at_id_idx" for status in STATUSES),
+        "items_search_vector_idx",
+    ):
+        op.execute(f"DROP INDEX IF EXISTS public.{index}")
+
+
+def upgrade() -> None:
+    # Rewrites every row into the partitioned table while holding an ACCESS EXCLUSIVE
+    # lock on items — reads and writes wait until the migration commits. Run it in a
+    # maintenance window on large installs. The copy fires no count triggers (they
+    # are attached afterwards), so item_counts stays exact.
+    op.execute("LOCK TABLE public.items IN ACCESS EXCLUSIVE MODE")
+    _set_aside_old_table("items_unpartitioned")
+
+    _create_table("PARTITION BY RANGE (created_at)")
+    op.execute("ALTER TABLE public.items ADD CONSTRAINT items_pkey PRIMARY KEY (id, created_at)")
+    op.execute(ENSURE_PARTITION_FUNCTION)
+    op.execute("CREATE TABLE public.items_default PARTITION OF public.items DEFAULT")
+    # One partition per month from the oldest row through PREMAKE_MONTHS ahead.
+    op.execute(
+        f"""
+        SELECT public.items_ensure_partition(month::date)
+        FROM generate_series(
+            date_trunc('month', coalesce(
+                (SELECT min(created_at) FROM public.items_unpartitioned), now()
+            ) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{PREMAKE_MONTHS} months',
+            interval '1 month'
+        ) AS month
+        """
+    )
+    op.execute(f"INSERT INTO public.items ({COLUMNS}) SELECT {COLUMNS} FROM public.items_unpartitioned")
+    op.execute("DROP TABLE public.items_unpartitioned")
+
+    _create_indexes()
+    _create_count_triggers()
+
+
+def downgrade() -> None:
+    op.execute("LOCK TABLE public.items IN ACCESS EXCLUSIVE MODE")
+    _set_aside_old_table("items_partitioned")
+
+    _create_table("")
+    op.execute("ALTER TABLE public.items ADD CONSTRAINT items_pkey PRIMARY KEY (id)")
+    op.execute(f"INSERT INTO public.items ({COLUMNS}) SELECT {COLUMNS} FROM public.items_partitioned")
+    # Drops every attached partition with it; detached (retired) ones are left alone.
+    op.execute("DROP TABLE public.items_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS public.items_ensure_partition(date)")
+
+    _create_indexes()
+    _create_count_triggers()
@@ -0,0 +1,89 @@
+"""items_ensure_partition moves the month's rows out of items_default
+
+Revision ID: 0007_items_partition_rescue
+Revises: 0006_items_partitioned
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+revision = "0007_items_partition_rescue"
+down_revision = "0006_items_partitioned"
+branch_labels = None
+depends_on = None
+
+# Frozen copies of the partition function in ITEM_PARTITIONS_DDL: this migration's
+# version, and the 0006 one it replaces.
+ENSURE_PARTITION_FUNCTION = """
+    CREATE OR REPLACE FUNCTION public.items_ensure_partition(month date) RETURNS text
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        first_day timestamp := date_trunc('month', month::timestamp);
+        partition_name text := 'items_p' || to_char(first_day, 'YYYY_MM');
+        -- Bounds are UTC month starts, whatever the session's TimeZone.
+        lower_bound timestamptz := first_day AT TIME ZONE 'UTC';
+        upper_bound timestamptz := (first_day + interval '1 month') AT TIME ZONE 'UTC';
+        stranded boolean;
+    BEGIN
+        IF to_regclass(format('public.%I', partition_name)) IS NOT NULL THEN
+            RETURN partition_name;
+        END IF;
+        -- Rows of this month already in items_default (maintenance fell behind, or a
+        -- future created_at) would make the CREATE fail its check against the
+        -- default. Park them, create the partition, and insert them back. Both
+        -- statements go through items, so the count triggers cancel out.
+        PERFORM 1 FROM public.items WHERE created_at >= lower_bound AND created_at < upper_bound LIMIT 1;
+        stranded := FOUND;
+        IF stranded THEN
+            CREATE TEMP TABLE items_stranded ON COMMIT DROP AS
+                SELECT id, name, description, summary, status, created_at, updated_at
+                FROM public.items WITH NO DATA;
+            WITH moved AS (
+                DELETE FROM public.items WHERE created_at >= lower_bound AND created_at < upper_bound
+                RETURNING id, name, description, summary, status, created_at, updated_at
+            )
+            INSERT INTO items_stranded SELECT * FROM moved;
+        END IF;
+        EXECUTE format(
+            'CREATE TABLE public.%I PARTITION OF public.items FOR VALUES FROM (%L) TO (%L)',
+            partition_name,
+            lower_bound,
+            upper_bound
+        );
+        IF stranded THEN
+            INSERT INTO public.items (id, name, description, summary, status, created_at, updated_at)
+            SELECT id, name, description, summary, status, created_at, updated_at FROM items_stranded;
+            DROP TABLE items_stranded;
+        END IF;
+        RETURN partition_name;
+    END;
+    $$
+"""
+
+PREVIOUS_ENSURE_PARTITION_FUNCTION = """
+    CREATE OR REPLACE FUNCTION public.items_ensure_partition(month date) RETURNS text
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        first_day timestamp := date_trunc('month', month::timestamp);
+        partition_name text := 'items_p' || to_char(first_day, 'YYYY_MM');
+    BEGIN
+        -- Bounds are UTC month starts, whatever the session's TimeZone.
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS public.%I PARTITION OF public.items FOR VALUES FROM (%L) TO (%L)',
+            partition_name,
+            first_day AT TIME ZONE 'UTC',
+            (first_day + interval '1 month') AT TIME ZONE 'UTC'
+        );
+        RETURN partition_name;
+    END;
+    $$
+"""
+
+
+def upgrade() -> None:
+    op.execute(ENSURE_PARTITION_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_ENSURE_PARTITION_FUNCTION)
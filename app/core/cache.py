@@ -0,0 +1,47 @@
+from redis.exceptions import RedisError
+
+from app.core.config import cache_config
+from app.core.db.async_ import async_redis
+from app.core.logger import log
+
+# Read-through cache primitives on the shared async Redis client. The cache is an
+# optimization only: every Redis failure is logged and treated as a miss / no-op,
+# so an unavailable Redis degrades to database reads instead of failing requests.
+#
+# Invalidation writes a short-lived empty tombstone instead of deleting the key.
+# Fills use SET NX, so a reader that loaded the row before the writer committed
+# cannot put the stale copy back while the tombstone lives.
+
+_TOMBSTONE = ""
+
+
+async def cache_get(key: str) -> str | None:
+    if not cache_config.CACHE_ENABLED:
+        return None
+    try:
+        value = await async_redis.get(key)
+    except RedisError as exc:
+        log.warning("cache_get_failed", key=key, error=str(exc))
+        return None
+    return value or None
+
+
+async def cache_fill(key: str, value: str, ttl: int | None = None) -> None:
+    if not cache_config.CACHE_ENABLED or len(value.encode("utf-8")) > cache_config.CACHE_MAX_VALUE_BYTES:
+        return
+    try:
+        await async_redis.set(key, value, ex=ttl or cache_config.CACHE_TTL_SECONDS, nx=True)
+    except RedisError as exc:
+        log.warning("cache_fill_failed", key=key, error=str(exc))
+
+
+async def cache_invalidate(*keys: str) -> None:
+    if not cache_config.CACHE_ENABLED or not keys:
+        return
+    try:
+        async with async_redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(key, _TOMBSTONE, ex=cache_config.CACHE_TOMBSTONE_SECONDS)
+            await pipe.execute()
+    except RedisError as exc:
+        log.warning("cache_invalidate_failed", keys=len(keys), error=str(exc))
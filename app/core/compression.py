@@ -0,0 +1,121 @@
+import zlib
+from typing import Protocol
+
+# Response codecs for CompressionMiddleware (app/core/security.py). gzip is stdlib and
+# always available; zstd and brotli come with the `compression` extra
+# (`uv sync --extra compression`, installed in the Docker image) — without it clients
+# fall back to gzip.
+try:
+    import zstandard  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+try:
+    import brotli  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Already-compressed media gains nothing; event streams must reach the client
+# byte-for-byte as written.
+SKIP_CONTENT_TYPES: tuple[str, ...] = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/zstd",
+    "application/octet-stream",
+    "text/event-stream",
+)
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipEncoder:
+    def __init__(self, level: int = 6) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        # Sync flush: everything written so far becomes decodable by the client, so
+        # streamed chunks are not held back until the response ends.
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class ZstdEncoder:
+    def __init__(self, level: int = 3) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()  # type: ignore[union-attr]
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)  # type: ignore[union-attr]
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)  # type: ignore[union-attr]
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int = 4) -> None:
+        self._compressor = brotli.Compressor(quality=quality)  # type: ignore[union-attr]
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+# Server preference, best first. Only codecs whose library is importable are offered.
+ENCODERS: dict[str, type[Encoder]] = {
+    **({"zstd": ZstdEncoder} if zstandard is not None else {}),
+    **({"br": BrotliEncoder} if brotli is not None else {}),
+    "gzip": GzipEncoder,
+}
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    # Picks the server-preferred codec among those the client accepts with q > 0.
+    if not accept_encoding:
+        return None
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ENCODERS:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def is_compressible(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    content_type = content_type.lower()
+    return not any(content_type.startswith(prefix) for prefix in SKIP_CONTENT_TYPES)
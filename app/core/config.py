@@ -1,4 +1,4 @@
-from typing import Self
+from typing import Literal, Self
 
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -46,8 +46,56 @@ class DatabaseConfig(Config):
     POOL_TIMEOUT: int | None = None
     POOL_RECYCLE: int | None = None
 
+    # Set when DATABASE_URL (and replica URLs) point at PgBouncer in transaction
+    # pooling mode: psycopg's automatic prepared statements are disabled (a prepared
+    # statement lives on one server connection, the next transaction may get another)
+    # and SQLAlchemy stops pooling — PgBouncer owns the pool, POOL_* are ignored.
+    # Run migrations against Postgres directly (they rely on session-level SET).
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False
+
+    # Optional streaming replicas for read-only endpoints (JSON list of URLs). Each
+    # gets its own pool sized like the primary's. Empty → reads use the primary.
+    DATABASE_REPLICA_URLS: list[str] = []
+    # least_busy picks the replica with the fewest checked-out connections.
+    REPLICA_SELECTION: Literal["round_robin", "least_busy"] = "least_busy"
+    # A replica that fails to connect is skipped (reads fall back) for this long.
+    REPLICA_RETRY_SECONDS: int = 30
+    # AsyncReadDb sessions (replica or primary) run in autocommit — no BEGIN/ROLLBACK
+    # round trips per read request (see app/core/db/replicas.py).
+    READ_SESSION_AUTOCOMMIT: bool = True
+
+    # Instrumentation thresholds (app/core/db/instrumentation.py): statements and
+    # pool checkouts slower than these are logged as warnings.
+    DB_SLOW_QUERY_MS: int = 200
+    DB_SLOW_CHECKOUT_MS: int = 100
+
+    # Monthly `items` partitions, maintained by tasks.item_partitions: months created
+    # ahead of time, and retention — partitions older than ITEMS_RETENTION_MONTHS
+    # (unset = keep everything) are detached, or detached and dropped.
+    ITEMS_PARTITION_PREMAKE_MONTHS: int = 3
+    ITEMS_RETENTION_MONTHS: int | None = None
+    ITEMS_RETENTION_ACTION: Literal["detach", "drop"] = "detach"
+    # Longest a retention DETACH may wait for its locks before it gives up until the
+    # next run (items reads and writes queue behind a waiting ACCESS EXCLUSIVE).
+    ITEMS_PARTITION_LOCK_TIMEOUT_MS: int = 2000
+
+    # Nightly archival (tasks.example_cleanup): active items not updated for
+    # ITEMS_ARCHIVE_AFTER_DAYS are archived ITEMS_ARCHIVE_CHUNK_SIZE rows per
+    # transaction, for at most ITEMS_ARCHIVE_TIME_BUDGET_SECONDS per run.
+    ITEMS_ARCHIVE_AFTER_DAYS: int = 180
+    ITEMS_ARCHIVE_CHUNK_SIZE: int = 1000
+    ITEMS_ARCHIVE_TIME_BUDGET_SECONDS: int = 240
+
+    # Per-request / per-task query budget (N+1 detector). Defaults to "warn" in
+    # development and "off" elsewhere; the test suite runs with "raise".
+    DB_QUERY_BUDGET_MODE: Literal["off", "warn", "raise"] | None = None
+    DB_QUERY_BUDGET: int = 30
+    DB_TIME_BUDGET_MS: int = 1000
+    DB_REPEATED_STATEMENT_LIMIT: int = 5
+
     @model_validator(mode="after")
     def set_environment_defaults(self) -> Self:
+        self.DB_QUERY_BUDGET_MODE = self.DB_QUERY_BUDGET_MODE or ("warn" if self.is_development else "off")
         if self.is_production:
             self.POOL_SIZE = self.POOL_SIZE or 20
             self.POOL_MAX_OVERFLOW = self.POOL_MAX_OVERFLOW or 10
@@ -67,6 +115,19 @@ class DatabaseConfig(Config):
         return self
 
 
+class CacheConfig(Config):
+    # Redis read-through caches (e.g. single-item lookups). Entries larger than
+    # CACHE_MAX_VALUE_BYTES are not cached; cap total memory on the Redis side with
+    # maxmemory + an LRU eviction policy.
+    CACHE_ENABLED: bool = True
+    CACHE_TTL_SECONDS: int = 300
+    CACHE_MAX_VALUE_BYTES: int = 64 * 1024
+    # How long an invalidated key refuses refills — must outlast the writer's
+    # commit so a reader that saw pre-commit data cannot re-cache it. Replica lag
+    # does not count: only primary reads fill the cache.
+    CACHE_TOMBSTONE_SECONDS: int = 5
+
+
 class AWSConfig(Config):
     # Credentials are only needed for AWS Bedrock (AI agents). Leave unset to fall
     # back to the default boto3 credential chain (env / profile / instance role).
@@ -85,6 +146,8 @@ class AIConfig(Config):
     AI_MAX_TOKENS: int = 8_192
     AI_REQUEST_LIMIT: int = 10
     AI_REQUEST_TOKEN_LIMIT: int = 200_000
+    # Concurrent model calls per batch task (e.g. tasks.summarize_items).
+    AI_BATCH_CONCURRENCY: int = 8
 
 
 ################################################################################
@@ -126,6 +189,33 @@ class CeleryConfig(Config):
     # containers, not by raising per-worker concurrency. Override via env if needed.
     WORKER_CONCURRENCY: int = 1
     WORKER_MAX_TASKS_PER_CHILD: int = 1000
+    # "asyncio" instead runs WORKER_ASYNC_CONCURRENCY tasks at once on one event loop
+    # in a single process (app/workers/runner.py) — for I/O-bound queues such as heavy
+    # (LLM calls). Keep POOL_SIZE + POOL_MAX_OVERFLOW at or above that concurrency.
+    WORKER_POOL: Literal["prefork", "asyncio"] = "prefork"
+    WORKER_ASYNC_CONCURRENCY: int = 8
+    # Delivery markers (app/workers/idempotency.py). "keys" keeps one Redis string per
+    # delivered task for 24h — exact, ~100 B each, one GET per check. "bloom" sets bits
+    # in hourly Bloom-filter bitmaps: memory is fixed at 25 x IDEMPOTENCY_BLOOM_BITS / 8
+    # bytes (24h window + the current hour) however many tasks run, but a false
+    # positive skips a task and every check reads 25 buckets x HASHES bits.
+    # The defaults target 100k deliveries/hour: 512 KiB per bucket, 12.5 MiB in all,
+    # ~2e-7 false positives per bucket (~5e-6 per check). Break-even with "keys" is
+    # ~5k deliveries/hour; below that, stay on "keys". Scale BITS with the hourly rate
+    # (~42 bits per delivery keeps this rate).
+    IDEMPOTENCY_MARKER_STORE: Literal["keys", "bloom"] = "keys"
+    IDEMPOTENCY_BLOOM_BITS: int = 2**22
+    IDEMPOTENCY_BLOOM_HASHES: int = 10
+    # API-side publisher for async enqueue (app/workers/publisher.py): messages
+    # buffered or in flight, per-batch size and linger, fresh-connection retries
+    # before a failed message is dropped, how long enqueue waits for buffer room
+    # before rejecting, and the slow-enqueue warning threshold.
+    TASK_PUBLISH_CAPACITY: int = 1000
+    TASK_PUBLISH_BATCH_SIZE: int = 50
+    TASK_PUBLISH_LINGER_MS: int = 5
+    TASK_PUBLISH_RETRIES: int = 1
+    TASK_ENQUEUE_TIMEOUT_SECONDS: float = 1.0
+    TASK_ENQUEUE_SLOW_MS: int = 100
 
     @model_validator(mode="after")
     def set_environment_defaults(self) -> Self:
@@ -141,5 +231,6 @@ class CeleryConfig(Config):
 api_config = ApiConfig()
 celery_config = CeleryConfig()
 database_config = DatabaseConfig()  # type: ignore[call-arg]
+cache_config = CacheConfig()
 aws_config = AWSConfig()
 ai_config = AIConfig()
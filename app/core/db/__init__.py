@@ -1,26 +1,36 @@
 from app.core.db.async_ import (
     AsyncDb,
+    AsyncReadDb,
     AsyncRedis,
     AsyncSessionLocal,
+    AsyncSnapshotReadDb,
     _get_async_db,
+    _get_async_read_db,
     _get_async_redis,
+    _get_async_snapshot_read_db,
     async_db_session,
     async_engine,
     async_redis,
+    replica_set,
 )
 from app.core.db.base import Base, metadata
 
 __all__ = [
     "AsyncDb",
+    "AsyncReadDb",
     "AsyncRedis",
     "AsyncSessionLocal",
+    "AsyncSnapshotReadDb",
     "Base",
     "_get_async_db",
+    "_get_async_read_db",
     "_get_async_redis",
+    "_get_async_snapshot_read_db",
     "async_db_session",
     "async_engine",
     "async_redis",
     "metadata",
+    "replica_set",
 ]
 
 # Import all models so SQLAlchemy can resolve relationships and Base.metadata is
@@ -7,21 +7,17 @@ from redis.asyncio import Redis as AsyncRedisClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import database_config
-from app.core.db.base import _to_psycopg_url
+from app.core.db.base import _to_psycopg_url, engine_options
+from app.core.db.instrumentation import instrument_engine
+from app.core.db.replicas import ReplicaSet, read_session
 
 ################################################################################
 # Postgres #
 ################################################################################
 
 
-async_engine = create_async_engine(
-    _to_psycopg_url(database_config.DATABASE_URL),
-    echo=False,
-    pool_pre_ping=True,
-    pool_size=database_config.POOL_SIZE,
-    max_overflow=database_config.POOL_MAX_OVERFLOW,
-    pool_timeout=database_config.POOL_TIMEOUT,
-    pool_recycle=database_config.POOL_RECYCLE,
+async_engine = instrument_engine(
+    create_async_engine(_to_psycopg_url(database_config.DATABASE_URL), echo=False, **engine_options())
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -46,6 +42,40 @@ async def _get_async_db() -> AsyncGenerator[AsyncSession]:
 AsyncDb = Annotated[AsyncSession, Depends(_get_async_db)]
 
 
+# Read-only endpoints take AsyncReadDb: a read-only session on a healthy replica (see
+# app/core/db/replicas.py), or on the primary engine when no replicas are configured
+# or reachable. Never write through it — read sessions refuse flushes and DML.
+replica_set = ReplicaSet.from_urls(
+    database_config.DATABASE_REPLICA_URLS,
+    selection=database_config.REPLICA_SELECTION,
+    retry_seconds=database_config.REPLICA_RETRY_SECONDS,
+    autocommit=database_config.READ_SESSION_AUTOCOMMIT,
+)
+
+
+async def _open_read_session(primary: AsyncSession, *, autocommit: bool) -> AsyncSession:
+    session = await replica_set.open_session(primary, autocommit=autocommit)
+    return session or read_session(async_engine, primary, autocommit=autocommit)
+
+
+async def _get_async_read_db(primary: AsyncDb) -> AsyncGenerator[AsyncSession]:
+    async with await _open_read_session(primary, autocommit=database_config.READ_SESSION_AUTOCOMMIT) as session:
+        yield session
+
+
+AsyncReadDb = Annotated[AsyncSession, Depends(_get_async_read_db)]
+
+
+# Same, but inside a transaction block: server-side cursors (streamed results) only
+# exist in one, and every statement of the request sees the same snapshot.
+async def _get_async_snapshot_read_db(primary: AsyncDb) -> AsyncGenerator[AsyncSession]:
+    async with await _open_read_session(primary, autocommit=False) as session:
+        yield session
+
+
+AsyncSnapshotReadDb = Annotated[AsyncSession, Depends(_get_async_snapshot_read_db)]
+
+
 # Context manager for Celery tasks — auto-commits on success, rolls back on error.
 @asynccontextmanager
 async def async_db_session() -> AsyncGenerator[AsyncSession]:
@@ -1,6 +1,11 @@
+from typing import Any
+
 from sqlalchemy import MetaData
 from sqlalchemy.orm import DeclarativeBase
 
+from app.core.config import database_config
+from app.core.db.instrumentation import InstrumentedAsyncPool, InstrumentedNullPool
+
 # PostgreSQL naming convention for constraints and indexes.
 # See .claude/rules/backend/database.md for the conventions these produce.
 POSTGRES_INDEXES_NAMING_CONVENTION = {
@@ -25,3 +30,18 @@ def _to_psycopg_url(url: str) -> str:
     if url.startswith("postgresql+asyncpg://"):
         return url.replace("postgresql+asyncpg://", "postgresql+psycopg://", 1)
     return url
+
+
+def engine_options() -> dict[str, Any]:
+    # create_async_engine kwargs shared by the primary and every replica.
+    if database_config.DB_PGBOUNCER_TRANSACTION_MODE:
+        # prepare_threshold=None: never PREPARE, whatever the statement's use count.
+        return {"poolclass": InstrumentedNullPool, "connect_args": {"prepare_threshold": None}}
+    return {
+        "poolclass": InstrumentedAsyncPool,
+        "pool_pre_ping": True,
+        "pool_size": database_config.POOL_SIZE,
+        "max_overflow": database_config.POOL_MAX_OVERFLOW,
+        "pool_timeout": database_config.POOL_TIMEOUT,
+        "pool_recycle": database_config.POOL_RECYCLE,
+    }
@@ -0,0 +1,170 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool
+
+from app.core.config import database_config
+from app.core.logger import log
+
+# Pool and statement instrumentation for every engine (primary and replicas).
+#
+# - Checkout wait: how long a request queued for a pool connection. Slow waits are
+#   logged with the pool's in-use / overflow numbers — the saturation signal. In
+#   PgBouncer mode it is the time to connect to the pooler.
+# - Statement timings: every cursor execute; slow ones are logged with the SQL.
+# - Per-request totals (queries, DB time, pool wait) accumulate in a contextvar
+#   that LoggingMiddleware opens and adds to the request log line.
+#
+# Log lines carry request_id through structlog's contextvars like any other log.
+#
+# Query budget (DB_QUERY_BUDGET_MODE, on in development and tests): the same
+# per-request / per-task totals are checked against DB_QUERY_BUDGET statements,
+# DB_TIME_BUDGET_MS and DB_REPEATED_STATEMENT_LIMIT executions of one statement
+# shape (the N+1 signature). "warn" logs once at the end of the request or task
+# with the most repeated shapes; "raise" fails at the offending statement.
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    duration: float = 0.0
+    pool_wait: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def violations(self) -> list[str]:
+        found = []
+        if self.queries > database_config.DB_QUERY_BUDGET:
+            found.append(f"{self.queries} statements (budget {database_config.DB_QUERY_BUDGET})")
+        if self.duration * 1000 > database_config.DB_TIME_BUDGET_MS:
+            found.append(
+                f"{self.duration * 1000:.0f} ms in the database (budget {database_config.DB_TIME_BUDGET_MS} ms)"
+            )
+        repeated = self.repeated_shapes()
+        if repeated:
+            found.append(
+                f"{len(repeated)} statement shape(s) run more than {database_config.DB_REPEATED_STATEMENT_LIMIT}x"
+            )
+        return found
+
+    def repeated_shapes(self, top: int = 5) -> list[tuple[str, int]]:
+        limit = database_config.DB_REPEATED_STATEMENT_LIMIT
+        return [(shape, count) for shape, count in self.shapes.most_common(top) if count > limit]
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> QueryStats:
+    stats = QueryStats()
+    _query_stats.set(stats)
+    return stats
+
+
+def current_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def stop_query_stats() -> None:
+    _query_stats.set(None)
+
+
+def check_query_budget(stats: QueryStats, scope: str) -> None:
+    # End-of-request / end-of-task report for "warn" mode ("raise" already failed
+    # at the statement that crossed the budget).
+    if database_config.DB_QUERY_BUDGET_MODE != "warn":
+        return
+    violations = stats.violations()
+    if violations:
+        log.warning(
+            "db_query_budget_exceeded",
+            scope=scope,
+            violations=violations,
+            repeated_statements=stats.repeated_shapes(),
+        )
+
+
+def _statement_shape(statement: str) -> str:
+    return " ".join(statement.split())[:300]
+
+
+def pool_status(pool: Pool) -> dict[str, int]:
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {}
+    return {
+        "pool_size": pool.size(),
+        "pool_in_use": pool.checkedout(),
+        "pool_idle": pool.checkedin(),
+        "pool_overflow": max(pool.overflow(), 0),
+    }
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    # There is no "before checkout" pool event, so time the checkout itself.
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _record_checkout(self, time.perf_counter() - started)
+
+
+class InstrumentedNullPool(NullPool):
+    # No pool to wait on (PgBouncer mode) — "checkout" is the connect to the pooler.
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _record_checkout(self, time.perf_counter() - started)
+
+
+def _record_checkout(pool: Pool, waited: float) -> None:
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.pool_wait += waited
+    if waited * 1000 >= database_config.DB_SLOW_CHECKOUT_MS:
+        log.warning("db_pool_checkout_slow", wait_ms=round(waited * 1000, 1), **pool_status(pool))
+
+
+def instrument_engine(engine: AsyncEngine) -> AsyncEngine:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, _cursor, statement, _parameters, _context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.duration += elapsed
+            if database_config.DB_QUERY_BUDGET_MODE != "off":
+                stats.shapes[_statement_shape(statement)] += 1
+                if database_config.DB_QUERY_BUDGET_MODE == "raise" and (violations := stats.violations()):
+                    raise QueryBudgetExceeded(f"{'; '.join(violations)}; repeated: {stats.repeated_shapes()}")
+        if elapsed * 1000 >= database_config.DB_SLOW_QUERY_MS:
+            log.warning(
+                "db_query_slow",
+                duration_ms=round(elapsed * 1000, 1),
+                statement=statement[:1000],
+                executemany=executemany,
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context) -> None:
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+
+    return engine
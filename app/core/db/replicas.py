@@ -0,0 +1,205 @@
+import itertools
+import time
+import weakref
+from collections.abc import Sequence
+from typing import Any, Literal
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import DBAPIError, InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.ddl import ExecutableDDLElement
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.core.db.base import _to_psycopg_url, engine_options
+from app.core.db.instrumentation import instrument_engine
+from app.core.logger import log
+
+# Read-replica routing for AsyncReadDb (app/core/db/async_.py).
+#
+# Every request that takes AsyncReadDb gets a session on one healthy replica, picked
+# round-robin or by fewest connections in use (counted here from pool checkout and
+# checkin events, so it works with PgBouncer mode's NullPool too; ties rotate). A replica that fails to connect
+# (or drops connections) is skipped for REPLICA_RETRY_SECONDS; with none left, reads
+# use the primary session.
+#
+# Read-your-writes: once the request's primary session has written (flush or DML),
+# the read session sends further statements through the primary session's own
+# connection — same transaction, so even uncommitted writes are visible.
+#
+# Read sessions are read-only: flushes, ORM DML and Core DML/DDL constructs raise
+# before reaching the server, on the session or on its connection. With
+# READ_SESSION_AUTOCOMMIT they run in autocommit: psycopg sends no BEGIN before the
+# first statement and there is nothing to ROLLBACK when the connection goes back to
+# the pool — two round trips fewer per read request. Each statement then sees its own
+# snapshot; reads that need one (server-side cursors, statements that must agree)
+# take AsyncSnapshotReadDb, whose transaction is opened READ ONLY so Postgres itself
+# refuses writes — raw SQL included. (Autocommit has no BEGIN to carry READ ONLY, so
+# there a raw text() write is only stopped by a replica being a hot standby.)
+#
+# Replica reads can lag the primary. Anything that outlives the request — a cache
+# fill above all — must come from the primary: primary_session() gives the session
+# whose reads see it.
+
+_WROTE = "wrote"
+_REPLICA = "replica"
+
+
+class ReplicaSession(Session):
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine | Connection:
+        primary: AsyncSession | None = self.info.get("primary")
+        if primary is not None and primary.sync_session.info.get(_WROTE):
+            return primary.sync_session.connection()
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+ReplicaSessionLocal = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=ReplicaSession,
+)
+
+
+_read_binds: weakref.WeakKeyDictionary[AsyncEngine, dict[bool, AsyncEngine]] = weakref.WeakKeyDictionary()
+
+
+def read_session(
+    engine: AsyncEngine, primary: AsyncSession | None = None, *, autocommit: bool = True, replica: bool = False
+) -> AsyncSession:
+    # replica=False: engine is the primary's (no replica configured or reachable).
+    return ReplicaSessionLocal(bind=_read_bind(engine, autocommit), info={"primary": primary, _REPLICA: replica})
+
+
+def primary_session(session: AsyncSession) -> AsyncSession | None:
+    # `session` itself when its reads see the primary (a primary session, a read
+    # session on the primary engine, or one sticking to the primary after a write);
+    # otherwise the request's primary session, or None without one.
+    info = session.sync_session.info
+    if not info.get(_REPLICA):
+        return session
+    primary: AsyncSession | None = info.get("primary")
+    if primary is not None and primary.sync_session.info.get(_WROTE):
+        return session
+    return primary
+
+
+def _read_bind(engine: AsyncEngine, autocommit: bool) -> AsyncEngine:
+    # One option engine per (engine, mode), so the guard below is registered once.
+    binds = _read_binds.setdefault(engine, {})
+    if autocommit not in binds:
+        options = {"isolation_level": "AUTOCOMMIT"} if autocommit else {"postgresql_readonly": True}
+        bind = engine.execution_options(**options)
+        event.listen(bind.sync_engine, "before_execute", _refuse_core_writes)
+        binds[autocommit] = bind
+    return binds[autocommit]
+
+
+def _refuse_core_writes(_conn: Connection, clauseelement: Any, *_args: Any) -> None:
+    # Core statements run on the session's connection skip the ORM events.
+    if isinstance(clauseelement, UpdateBase | ExecutableDDLElement):
+        raise InvalidRequestError("read session is read-only — write through AsyncDb")
+
+
+@event.listens_for(ReplicaSession, "before_flush")
+def _refuse_flush(_session: Session, _flush_context: Any, _instances: Any) -> None:
+    raise InvalidRequestError("read session is read-only — write through AsyncDb")
+
+
+@event.listens_for(ReplicaSession, "do_orm_execute")
+def _refuse_dml(orm_execute_state: Any) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        raise InvalidRequestError("read session is read-only — write through AsyncDb")
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, _flush_context: Any) -> None:
+    session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(orm_execute_state: Any) -> None:
+    # Bulk insert/update/delete statements bypass the flush.
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WROTE] = True
+
+
+class ReplicaSet:
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        *,
+        selection: Literal["round_robin", "least_busy"] = "least_busy",
+        retry_seconds: float = 30,
+        autocommit: bool = True,
+    ) -> None:
+        self.engines = list(engines)
+        self.selection = selection
+        self.retry_seconds = retry_seconds
+        self.autocommit = autocommit
+        self._down_until: dict[AsyncEngine, float] = {}
+        self._in_use = dict.fromkeys(self.engines, 0)
+        self._turn = itertools.count()
+        for engine in self.engines:
+            event.listen(engine.sync_engine, "handle_error", self._on_error(engine))
+            event.listen(engine.sync_engine.pool, "checkout", self._count_in_use(engine, 1))
+            event.listen(engine.sync_engine.pool, "checkin", self._count_in_use(engine, -1))
+
+    @classmethod
+    def from_urls(cls, urls: Sequence[str], **kwargs: Any) -> "ReplicaSet":
+        engines = [
+            instrument_engine(create_async_engine(_to_psycopg_url(url), echo=False, **engine_options())) for url in urls
+        ]
+        return cls(engines, **kwargs)
+
+    def healthy(self) -> list[AsyncEngine]:
+        now = time.monotonic()
+        return [engine for engine in self.engines if self._down_until.get(engine, 0.0) <= now]
+
+    def pick(self) -> AsyncEngine | None:
+        candidates = self.healthy()
+        if not candidates:
+            return None
+        start = next(self._turn) % len(candidates)
+        if self.selection == "least_busy":
+            # Rotated first, so idle replicas share the load instead of the first taking it all.
+            return min(candidates[start:] + candidates[:start], key=self.in_use)
+        return candidates[start]
+
+    def in_use(self, engine: AsyncEngine) -> int:
+        return self._in_use.get(engine, 0)
+
+    def mark_down(self, engine: AsyncEngine) -> None:
+        if self._down_until.get(engine, 0.0) <= time.monotonic():
+            log.warning("replica_marked_down", replica=engine.url.render_as_string(), seconds=self.retry_seconds)
+        self._down_until[engine] = time.monotonic() + self.retry_seconds
+
+    async def open_session(self, primary: AsyncSession, *, autocommit: bool | None = None) -> AsyncSession | None:
+        # Connects eagerly so an unreachable replica is detected here — and the
+        # request falls through to the next one — rather than failing mid-handler.
+        while (engine := self.pick()) is not None:
+            session = read_session(
+                engine, primary, autocommit=self.autocommit if autocommit is None else autocommit, replica=True
+            )
+            try:
+                await session.connection()
+            except DBAPIError:
+                await session.close()
+                self.mark_down(engine)
+                continue
+            return session
+        return None
+
+    def _on_error(self, engine: AsyncEngine):
+        def handle_error(context: ExceptionContext) -> None:
+            if context.is_disconnect:
+                self.mark_down(engine)
+
+        return handle_error
+
+    def _count_in_use(self, engine: AsyncEngine, delta: int):
+        def count(*_args: Any) -> None:
+            self._in_use[engine] += delta
+
+        return count
@@ -13,7 +13,10 @@ ERRORS = {
     "validation_error": "api.general.validation_error",
     "conflict": "api.general.conflict",
     "file_too_large": "api.general.file_too_large",
+    "invalid_cursor": "api.general.invalid_cursor",
+    "task_queue_full": "api.general.task_queue_full",
     ### Items (example feature) ###
     "item_not_found": "api.items.item_not_found",
     "item_already_summarized": "api.items.item_already_summarized",
+    "invalid_fields": "api.items.invalid_fields",
 }
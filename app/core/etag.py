@@ -0,0 +1,48 @@
+import hashlib
+
+from fastapi import Response
+
+# Conditional GET helpers (RFC 9110 §8.8.3 / §13.1.2). If-None-Match always uses weak
+# comparison, so W/"x" and "x" match each other — compression middleware may
+# weaken a strong tag on the way out without breaking revalidation.
+
+
+def make_etag(*parts: object, weak: bool = False) -> str:
+    return _format_tag(_digest("|".join(str(part) for part in parts).encode("utf-8")), weak=weak)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = _opaque_tag(etag)
+    return any(_opaque_tag(candidate) == opaque for candidate in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def conditional_response(response: Response, if_none_match: str | None) -> Response:
+    # Weak ETag over the rendered body, for payloads without a cheap version (list
+    # pages). Saves the transfer, not the query.
+    etag = _format_tag(_digest(bytes(response.body)), weak=True)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _format_tag(digest: str, *, weak: bool) -> str:
+    return f'W/"{digest}"' if weak else f'"{digest}"'
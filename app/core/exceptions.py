@@ -42,6 +42,10 @@ def raise_validation_error(error_key: str, **kwargs) -> Never:
     raise APIException(error_key, 422, **kwargs)
 
 
+def raise_service_unavailable(error_key: str, **kwargs) -> Never:
+    raise APIException(error_key, 503, **kwargs)
+
+
 def raise_server_error(error_key: str = "server_error", **kwargs) -> Never:
     raise APIException(error_key, 500, **kwargs)
 
@@ -1,12 +1,23 @@
+import base64
+import binascii
+import json
 from dataclasses import dataclass
+from typing import Literal
 
 from fastapi import Query
 
+from app.core.exceptions import raise_bad_request
+
+# How list endpoints report totals: "exact" reads maintained counters, "estimated"
+# reads planner statistics (no table access at all, only as fresh as ANALYZE).
+TotalMode = Literal["exact", "estimated"]
+
 
 @dataclass
 class Pagination:
     page: int
     page_size: int
+    cursor: str | None = None
 
 
 def pagination_params(default_page_size: int = 10):
@@ -15,7 +26,26 @@ def pagination_params(default_page_size: int = 10):
     def dependency(
         page: int = Query(1, ge=1),
         page_size: int = Query(default_page_size, ge=1, le=100),
+        cursor: str | None = Query(None, description="Opaque `next_cursor` from a previous page (keyset mode)."),
     ) -> Pagination:
-        return Pagination(page=page, page_size=page_size)
+        return Pagination(page=page, page_size=page_size, cursor=cursor)
 
     return dependency
+
+
+# Cursors are opaque to clients: a urlsafe-base64 JSON array of the sort-key values
+# of the last row on the page. Each feature decides what goes in (and parses it back).
+def encode_cursor(*values: str) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> list[str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise_bad_request("invalid_cursor")
+    if not isinstance(values, list) or len(values) != size or not all(isinstance(v, str) for v in values):
+        raise_bad_request("invalid_cursor")
+    return values
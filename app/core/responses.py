@@ -1,6 +1,7 @@
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
 
 T = TypeVar("T")
 
@@ -17,3 +18,30 @@ MESSAGES = {
     "created": "api.general.created",
     "deleted": "api.general.deleted",
 }
+
+
+_JSON = TypeAdapter(Any)
+
+
+class FastJSONResponse(JSONResponse):
+    # Encodes straight to bytes in pydantic-core (UUIDs, datetimes, etc. natively).
+    # Returning a Response from a route skips FastAPI's response_model re-validation
+    # and its dump-then-json.dumps passes; the bytes are identical because it is
+    # the same serializer. Keep response_model= on the decorator for OpenAPI.
+    def render(self, content: Any) -> bytes:
+        return _JSON.dump_json(content)
+
+
+def api_response(
+    payload: dict[str, Any],
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> FastJSONResponse:
+    # Takes a service result ({"message": ..., "data": ...}, either key optional) and
+    # emits the full APIResponse envelope, both keys always present, as response_model
+    # would. Services must already return data in the documented schema's shape.
+    return FastJSONResponse(
+        {"message": payload.get("message"), "data": payload.get("data")},
+        status_code=status_code,
+        headers=headers,
+    )
@@ -5,9 +5,12 @@ import uuid
 from fastapi.middleware.cors import CORSMiddleware
 from guard.middleware import SecurityMiddleware
 from guard.models import SecurityConfig
+from starlette.datastructures import MutableHeaders
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.config import api_config
+from app.core.compression import ENCODERS, Encoder, is_compressible, negotiate_encoding
+from app.core.config import api_config, database_config
+from app.core.db.instrumentation import check_query_budget, start_query_stats, stop_query_stats
 from app.core.errors import ERRORS
 from app.core.logger import bind_context, clear_context, log
 
@@ -16,6 +19,7 @@ MAX_UPLOAD_REQUEST_SIZE = 200 * 1024 * 1024  # 200MB (upload endpoints)
 # Substring match — add upload route prefixes here that should allow large bodies.
 LARGE_BODY_PATHS: tuple[str, ...] = ()
 HEALTHCHECK_PATH = "/up"  # liveness probe — skip logging
+COMPRESSION_MIN_SIZE = 1024  # bytes — smaller bodies aren't worth the CPU / framing
 
 
 def _get_header(headers: list[tuple[bytes, bytes]], name: bytes) -> str | None:
@@ -42,6 +46,7 @@ class LoggingMiddleware:
         client_ip = xff.split(",")[0].strip() if xff else (client[0] if client else "unknown")
 
         bind_context(request_id=request_id)
+        query_stats = start_query_stats()
         status_code = 500
         start_time = time.perf_counter()
 
@@ -51,6 +56,8 @@ class LoggingMiddleware:
                 status_code = message["status"]
                 raw_headers = list(message.get("headers", []))
                 raw_headers.append((b"x-request-id", request_id.encode("latin-1")))
+                if database_config.DB_QUERY_BUDGET_MODE != "off":
+                    raw_headers.append((b"x-db-query-count", str(query_stats.queries).encode("latin-1")))
                 message = {**message, "headers": raw_headers}
             await send(message)
 
@@ -58,6 +65,8 @@ class LoggingMiddleware:
             await self.app(scope, receive, send_wrapper)
         finally:
             duration = time.perf_counter() - start_time
+            stop_query_stats()
+            check_query_budget(query_stats, scope=f"{scope['method']} {scope['path']}")
             log.info(
                 f"{scope['method']} {scope['path']} {status_code} ({duration:.3f}s)",
                 method=scope["method"],
@@ -65,6 +74,9 @@ class LoggingMiddleware:
                 status_code=status_code,
                 duration=f"{duration:.3f}s",
                 client_ip=client_ip,
+                db_queries=query_stats.queries,
+                db_time=f"{query_stats.duration:.3f}s",
+                db_pool_wait=f"{query_stats.pool_wait:.3f}s",
             )
 
 
@@ -98,6 +110,88 @@ class RequestSizeLimitMiddleware:
         await self.app(scope, receive, send)
 
 
+class CompressionMiddleware:
+    # Pure ASGI: compresses as messages pass through, never buffering more than the
+    # current body chunk. A single-message body is compressed whole (with a new
+    # Content-Length); a streamed body is compressed chunk by chunk with a sync
+    # flush after each, so StreamingResponse consumers still see data immediately.
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(_get_header(scope["headers"], b"accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        encoder: Encoder | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, encoder, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+            if passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                headers = MutableHeaders(raw=start_message.setdefault("headers", []))
+                if not self._should_compress(start_message["status"], headers, body, more_body):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                encoder = ENCODERS[encoding]()
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                # The encoded bytes differ from the identity representation, so a
+                # strong validator must become weak (weak comparison still matches).
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    body = encoder.compress(body) + encoder.finish()
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start_message)
+
+            chunk = encoder.compress(body) + (encoder.flush() if more_body else encoder.finish())
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _should_compress(self, status: int, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if status < 200 or status in (204, 304) or "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        if not is_compressible(headers.get("content-type")):
+            return False
+        content_length = headers.get("content-length")
+        size = int(content_length) if content_length is not None else (None if more_body else len(body))
+        return size is None or size >= self.minimum_size
+
+
 def get_guard_security_config() -> SecurityConfig:
     return SecurityConfig(
         rate_limit=1000,
@@ -125,9 +219,10 @@ def get_guard_security_config() -> SecurityConfig:
 
 def setup_security_middleware(app) -> None:
     # Added last → outermost. Execution order (outer → inner):
-    # CORS → Logging → RequestSizeLimit → guard SecurityMiddleware.
+    # CORS → Logging → Compression → RequestSizeLimit → guard SecurityMiddleware.
     app.add_middleware(SecurityMiddleware, config=get_guard_security_config())
     app.add_middleware(RequestSizeLimitMiddleware)
+    app.add_middleware(CompressionMiddleware)
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(
         CORSMiddleware,
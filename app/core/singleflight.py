@@ -0,0 +1,83 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from app.core.logger import log
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+# In-process request coalescing ("single flight"): while a load for a key is in
+# flight, later callers for the same key await that load instead of starting their
+# own — a burst of N identical reads costs one query and one pool connection per
+# worker process, not N.
+#
+# Only for idempotent reads, and the shared result must be safe to hand to several
+# callers (plain values, not ORM instances bound to the leader's session). The
+# leader's own task runs the load; if the leader is cancelled the load is cancelled
+# with it and waiting followers retry (one of them becomes the new leader).
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    executed: int = 0
+    coalesced: int = 0
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+@dataclass
+class SingleFlight(Generic[K, T]):
+    name: str
+    stats: SingleFlightStats = field(default_factory=SingleFlightStats)
+    _flights: dict[K, _Flight] = field(default_factory=dict, repr=False)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: K, load: Callable[[], Awaitable[T]]) -> T:
+        self.stats.calls += 1
+        while (flight := self._flights.get(key)) is not None:
+            self.stats.coalesced += 1
+            flight.waiters += 1
+            try:
+                # Shield: a cancelled follower must not cancel the leader's load.
+                return await asyncio.shield(flight.task)
+            except asyncio.CancelledError:
+                if not flight.task.cancelled():
+                    raise
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise
+                # The leader went away mid-load; take over.
+
+        self.stats.executed += 1
+        task: asyncio.Task[T] = asyncio.ensure_future(load())
+        flight = _Flight(task=task)
+        self._flights[key] = flight
+        try:
+            return await task
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if flight.waiters:
+                log.debug("singleflight_coalesced", flight=self.name, waiters=flight.waiters)
+
+
+_registry: dict[str, SingleFlight[Any, Any]] = {}
+
+
+def single_flight(name: str) -> SingleFlight[Any, Any]:
+    # One named group per call site; stats for all groups via singleflight_stats().
+    return _registry.setdefault(name, SingleFlight(name))
+
+
+def singleflight_stats() -> dict[str, SingleFlightStats]:
+    return {name: flight.stats for name, flight in _registry.items()}
@@ -1,36 +1,132 @@
-from fastapi import APIRouter, Depends, status
+from uuid import UUID
 
-from app.core.pagination import Pagination, pagination_params
-from app.core.responses import MESSAGES, APIResponse
-from app.features.items.schemas import ItemCreate, ItemListResponse, ItemResponse
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.core.etag import conditional_response, not_modified
+from app.core.exceptions import raise_service_unavailable
+from app.core.pagination import Pagination, TotalMode, pagination_params
+from app.core.responses import MESSAGES, APIResponse, FastJSONResponse, api_response
+from app.features.items.schemas import (
+    MAX_SEARCH_QUERY_LENGTH,
+    ItemBatchGet,
+    ItemBatchGetResponse,
+    ItemBulkCreate,
+    ItemBulkResponse,
+    ItemCreate,
+    ItemListResponse,
+    ItemResponse,
+    ItemSearchResponse,
+    ItemStatus,
+)
+from app.features.items.service.batch_get import BatchGetItemsService
+from app.features.items.service.bulk_create import BulkCreateItemsService
 from app.features.items.service.create import CreateItemService
-from app.features.items.service.helpers import serialize_item
+from app.features.items.service.export import EXPORT_MEDIA_TYPES, ExportFormat, ExportItemsService
+from app.features.items.service.get import GetItemService
+from app.features.items.service.helpers import parse_item_fields
 from app.features.items.service.list import ListItemsService
+from app.features.items.service.search import SearchItemsService
 from app.repositories.items.dependencies import ValidItem
-from app.workers.queue import enqueue_summarize_item
+from app.workers.queue import TaskQueueFull, enqueue_summarize_item_async
 
 # No prefix on the router — use full paths in every decorator (keeps REST paths
 # explicit and greppable). Aggregated under /api/v1 in app/api/__init__.py.
 router = APIRouter(tags=["items"])
 
+# Routes return api_response(...) (pre-encoded bytes) rather than a dict, so FastAPI
+# does not re-validate and re-encode the payload. response_model= / status_code= on
+# the decorator still drive the OpenAPI schema; pass the same status to api_response.
+
 
 @router.post("/items", response_model=APIResponse[ItemResponse], status_code=status.HTTP_201_CREATED)
-async def create_item(body: ItemCreate, service: CreateItemService = Depends()) -> dict:
-    return await service.call(name=body.name, description=body.description)
+async def create_item(body: ItemCreate, service: CreateItemService = Depends()) -> FastJSONResponse:
+    result = await service.call(name=body.name, description=body.description)
+    return api_response(result, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/items/bulk", response_model=APIResponse[ItemBulkResponse], status_code=status.HTTP_201_CREATED)
+async def bulk_create_items(body: ItemBulkCreate, service: BulkCreateItemsService = Depends()) -> FastJSONResponse:
+    result = await service.call(items=[item.model_dump() for item in body.items])
+    return api_response(result, status_code=status.HTTP_201_CREATED)
+
+
+# Custom method (AIP-136 style): a read that takes its id list in the body, since
+# 100 UUIDs don't fit comfortably in a query string.
+@router.post("/items:batchGet", response_model=APIResponse[ItemBatchGetResponse])
+async def batch_get_items(body: ItemBatchGet, service: BatchGetItemsService = Depends()) -> FastJSONResponse:
+    result = await service.call(item_ids=body.ids)
+    return api_response(result)
 
 
-@router.get("/items", response_model=APIResponse[ItemListResponse])
+@router.get(
+    "/items",
+    response_model=APIResponse[ItemListResponse],
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified (If-None-Match)"}},
+)
 async def list_items(
     pagination: Pagination = Depends(pagination_params()),
+    item_status: ItemStatus | None = Query(None, alias="status"),
+    include_total: bool = Query(True),
+    total_mode: TotalMode = Query("exact"),
+    fields: str | None = Query(None, description="Comma-separated item fields to return, e.g. `name,status`."),
+    if_none_match: str | None = Header(None),
     service: ListItemsService = Depends(),
-) -> dict:
-    return await service.call(page=pagination.page, page_size=pagination.page_size)
+) -> Response:
+    result = await service.call(
+        page=pagination.page,
+        page_size=pagination.page_size,
+        cursor=pagination.cursor,
+        status=item_status,
+        include_total=include_total,
+        total_mode=total_mode,
+        fields=parse_item_fields(fields),
+    )
+    return conditional_response(api_response(result), if_none_match)
+
+
+# Declared before /items/{item_id} so "export" / "search" are not parsed as item ids.
+@router.get("/items/export", response_class=StreamingResponse)
+async def export_items(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    item_status: ItemStatus | None = Query(None, alias="status"),
+    service: ExportItemsService = Depends(),
+) -> StreamingResponse:
+    return StreamingResponse(
+        service.call(export_format=export_format, status=item_status),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="items.{export_format}"'},
+    )
 
 
-@router.get("/items/{item_id}", response_model=APIResponse[ItemResponse])
-async def get_item(item: ValidItem) -> dict:
-    # valid_item_id (dependency) already loaded the item or raised 404.
-    return {"data": serialize_item(item)}
+@router.get("/items/search", response_model=APIResponse[ItemSearchResponse])
+async def search_items(
+    q: str = Query(
+        min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH, description='Web-search syntax: words, "phrases", or, -not.'
+    ),
+    page_size: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description="Opaque `next_cursor` from a previous page."),
+    item_status: ItemStatus | None = Query(None, alias="status"),
+    service: SearchItemsService = Depends(),
+) -> FastJSONResponse:
+    result = await service.call(query=q, page_size=page_size, cursor=cursor, status=item_status)
+    return api_response(result)
+
+
+@router.get(
+    "/items/{item_id}",
+    response_model=APIResponse[ItemResponse],
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified (If-None-Match)"}},
+)
+async def get_item(
+    item_id: UUID,
+    if_none_match: str | None = Header(None),
+    service: GetItemService = Depends(),
+) -> Response:
+    result = await service.call(item_id=item_id, if_none_match=if_none_match)
+    if result.get("not_modified"):
+        return not_modified(result["etag"])
+    return api_response(result, headers={"ETag": result["etag"], "Cache-Control": "no-cache"})
 
 
 @router.post(
@@ -38,7 +134,10 @@ async def get_item(item: ValidItem) -> dict:
     response_model=APIResponse[None],
     status_code=status.HTTP_202_ACCEPTED,
 )
-async def summarize_item(item: ValidItem) -> dict:
+async def summarize_item(item: ValidItem) -> FastJSONResponse:
     # Offload the LLM work to the `ai` queue; the endpoint returns immediately.
-    enqueue_summarize_item(str(item.id))
-    return {"message": MESSAGES["success"]}
+    try:
+        await enqueue_summarize_item_async(str(item.id))
+    except TaskQueueFull:
+        raise_service_unavailable("task_queue_full")
+    return api_response({"message": MESSAGES["success"]}, status_code=status.HTTP_202_ACCEPTED)
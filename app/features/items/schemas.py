@@ -1,14 +1,30 @@
 import uuid
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
+MAX_BULK_ITEMS = 500
+MAX_SEARCH_QUERY_LENGTH = 200
+MAX_BATCH_GET_ITEMS = 100
+
+# Mirrors VALID_ITEM_STATUSES (app/repositories/items/models.py) for request validation.
+ItemStatus = Literal["active", "archived"]
+
 
 class ItemCreate(BaseModel):
     name: str = Field(min_length=1, max_length=255)
     description: str | None = None
 
 
+class ItemBulkCreate(BaseModel):
+    items: list[ItemCreate] = Field(min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class ItemBatchGet(BaseModel):
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=MAX_BATCH_GET_ITEMS)
+
+
 class ItemResponse(BaseModel):
     id: uuid.UUID
     name: str
@@ -19,9 +35,41 @@ class ItemResponse(BaseModel):
     updated_at: datetime
 
 
+class ItemFieldsResponse(BaseModel):
+    # A ?fields= subset of ItemResponse: id plus only the requested keys.
+    id: uuid.UUID
+    name: str | None = None
+    description: str | None = None
+    summary: str | None = None
+    status: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
 class ItemListResponse(BaseModel):
+    items: list[ItemResponse] | list[ItemFieldsResponse]
+    # page is null in keyset (cursor) mode; total_count / total_pages are null when
+    # the client passes include_total=false.
+    page: int | None
+    page_size: int
+    total_count: int | None
+    total_pages: int | None
+    next_cursor: str | None = None
+
+
+class ItemSearchResponse(BaseModel):
+    # Most relevant first; follow next_cursor for more (null on the last page).
     items: list[ItemResponse]
-    page: int
     page_size: int
-    total_count: int
-    total_pages: int
+    next_cursor: str | None = None
+
+
+class ItemBulkResponse(BaseModel):
+    items: list[ItemResponse]
+
+
+class ItemBatchGetResponse(BaseModel):
+    # Found items in request order (duplicates collapsed); ids with no row go to
+    # missing_ids instead of failing the whole batch.
+    items: list[ItemResponse]
+    missing_ids: list[uuid.UUID]
@@ -0,0 +1,20 @@
+from typing import Any
+from uuid import UUID
+
+from app.features.items.service.helpers import serialize_item
+from app.repositories.items import crud
+from app.services.base import ReadService
+
+
+class BatchGetItemsService(ReadService):
+    # Dashboard-style lookups: one query for the whole id list instead of one
+    # request (and round trip) per item.
+    async def call(self, *, item_ids: list[UUID]) -> dict[str, Any]:
+        requested = list(dict.fromkeys(item_ids))
+        found = {item.id: item for item in await crud.get_items_by_ids(self.db, requested)}
+        return {
+            "data": {
+                "items": [serialize_item(found[item_id]) for item_id in requested if item_id in found],
+                "missing_ids": [item_id for item_id in requested if item_id not in found],
+            }
+        }
@@ -0,0 +1,14 @@
+from typing import Any
+
+from app.core.responses import MESSAGES
+from app.features.items.service.helpers import serialize_item
+from app.repositories.items import crud
+from app.services.base import Service
+
+
+class BulkCreateItemsService(Service):
+    # One batched INSERT ... RETURNING and one commit for the whole payload.
+    async def call(self, *, items: list[dict[str, Any]]) -> dict[str, Any]:
+        created = await crud.create_items(self.db, items=items)
+        await self.db.commit()
+        return {"message": MESSAGES["created"], "data": {"items": [serialize_item(item) for item in created]}}
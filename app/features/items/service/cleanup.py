@@ -1,12 +1,88 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from redis.exceptions import RedisError
+
+from app.core.config import database_config
+from app.core.db.async_ import async_redis
 from app.core.logger import log
+from app.repositories.items import cache as item_cache
 from app.repositories.items import crud
 from app.services.base import Service
+from app.utils.time import utc_now
+
+# Where the last run stopped, as "<created_at iso>|<id>" — a run that hits its time
+# budget resumes from here next night instead of rescanning archived ground.
+CHECKPOINT_KEY = "items:archive:checkpoint"
+CHECKPOINT_TTL_SECONDS = 7 * 24 * 60 * 60
 
 
 class CleanupItemsService(Service):
-    # Example periodic (cron) task service. Idempotent — beat fires it again next
-    # interval, so the body just reports current state. Replace with real work.
+    # Periodic (cron) service behind tasks.example_cleanup: archives stale items in
+    # bounded chunks (crud.archive_stale_items), committing after each so no chunk
+    # holds its row locks for long or blocks API writes. Stops at the time budget and
+    # checkpoints progress; idempotent — the next run simply continues.
     async def call(self) -> dict:
-        _, total = await crud.list_items_with_count(self.db, limit=1, offset=0)
-        log.info("cleanup_items_ran", total_items=total)
-        return {"total_items": total}
+        started = time.monotonic()
+        stale_before = utc_now() - timedelta(days=database_config.ITEMS_ARCHIVE_AFTER_DAYS)
+        chunk_size = database_config.ITEMS_ARCHIVE_CHUNK_SIZE
+        checkpoint = await _load_checkpoint()
+        archived = chunks = 0
+        complete = False
+
+        while time.monotonic() - started < database_config.ITEMS_ARCHIVE_TIME_BUDGET_SECONDS:
+            keys = await crud.archive_stale_items(
+                self.db, stale_before=stale_before, limit=chunk_size, after=checkpoint
+            )
+            await self.db.commit()
+            await item_cache.invalidate_items(*(item_id for _, item_id in keys))
+            chunks += 1
+            archived += len(keys)
+            if len(keys) < chunk_size:
+                complete = True
+                break
+            checkpoint = max(keys)
+            await _save_checkpoint(checkpoint)
+            log.info("cleanup_items_chunk", chunk=chunks, archived=archived)
+
+        if complete:
+            await _clear_checkpoint()
+        elapsed = time.monotonic() - started
+        result = {
+            "archived": archived,
+            "chunks": chunks,
+            "complete": complete,
+            "duration": round(elapsed, 3),
+            "rows_per_second": round(archived / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+        log.info("cleanup_items_ran", **result)
+        return result
+
+
+# The checkpoint is an optimization: a Redis failure means the run starts from the
+# beginning of the index, never that it fails.
+async def _load_checkpoint() -> tuple[datetime, uuid.UUID] | None:
+    try:
+        raw = await async_redis.get(CHECKPOINT_KEY)
+    except RedisError as exc:
+        log.warning("cleanup_items_checkpoint_failed", error=str(exc))
+        return None
+    if not raw:
+        return None
+    created_at, item_id = raw.split("|")
+    return datetime.fromisoformat(created_at), uuid.UUID(item_id)
+
+
+async def _save_checkpoint(checkpoint: tuple[datetime, uuid.UUID]) -> None:
+    try:
+        await async_redis.set(CHECKPOINT_KEY, f"{checkpoint[0].isoformat()}|{checkpoint[1]}", ex=CHECKPOINT_TTL_SECONDS)
+    except RedisError as exc:
+        log.warning("cleanup_items_checkpoint_failed", error=str(exc))
+
+
+async def _clear_checkpoint() -> None:
+    try:
+        await async_redis.delete(CHECKPOINT_KEY)
+    except RedisError as exc:
+        log.warning("cleanup_items_checkpoint_failed", error=str(exc))
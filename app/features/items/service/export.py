@@ -0,0 +1,57 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Literal
+
+from pydantic_core import to_json
+from sqlalchemy import Row
+
+from app.features.items.service.helpers import ITEM_FIELDS
+from app.repositories.items import crud
+from app.services.base import SnapshotReadService
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_CHUNK_SIZE = 1_000
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+class ExportItemsService(SnapshotReadService):
+    # Streaming service: call() is an async generator of encoded chunks that the
+    # route hands to StreamingResponse. One chunk per server-side cursor fetch.
+    async def call(self, *, export_format: ExportFormat, status: str | None = None) -> AsyncIterator[bytes]:
+        encode = _encode_ndjson if export_format == "ndjson" else _encode_csv
+        if export_format == "csv":
+            yield _csv_line(ITEM_FIELDS)
+
+        async for rows in crud.stream_items(self.db, columns=ITEM_FIELDS, chunk_size=EXPORT_CHUNK_SIZE, status=status):
+            yield encode(rows)
+
+
+def _encode_ndjson(rows: Sequence[Row]) -> bytes:
+    # pydantic-core encodes UUIDs/datetimes exactly like the JSON API responses do.
+    return b"".join(to_json(row._asdict()) + b"\n" for row in rows)
+
+
+def _encode_csv(rows: Sequence[Row]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(_csv_value(value) for value in row)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_line(values: Sequence[str]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_value(value: object) -> object:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return "" if value is None else value
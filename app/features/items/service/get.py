@@ -0,0 +1,23 @@
+from typing import Any
+from uuid import UUID
+
+from app.core.etag import etag_matches
+from app.core.exceptions import raise_not_found
+from app.features.items.service.helpers import item_etag, serialize_item
+from app.repositories.items import crud
+from app.services.base import ReadService
+
+
+class GetItemService(ReadService):
+    # Conditional GET: when the client already holds a version (If-None-Match), probe
+    # only updated_at first and return not_modified without loading the item.
+    async def call(self, *, item_id: UUID, if_none_match: str | None = None) -> dict[str, Any]:
+        if if_none_match is not None:
+            updated_at = await crud.get_item_updated_at(self.db, item_id)
+            if updated_at is not None and etag_matches(if_none_match, etag := item_etag(item_id, updated_at)):
+                return {"etag": etag, "not_modified": True}
+
+        item = await crud.get_item_by_id_cached(self.db, item_id)
+        if item is None:
+            raise_not_found("item_not_found")
+        return {"etag": item_etag(item.id, item.updated_at), "data": serialize_item(item)}
@@ -1,17 +1,70 @@
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import Row
+
+from app.core.etag import make_etag
+from app.core.exceptions import raise_bad_request
+from app.core.pagination import decode_cursor, encode_cursor
 from app.repositories.items.models import Item
 
+# The public field set of an item — every item payload (JSON responses, exports)
+# is built from these, in this order.
+ITEM_FIELDS = ("id", "name", "description", "summary", "status", "created_at", "updated_at")
+
 
-def serialize_item(item: Item) -> dict[str, Any]:
+def serialize_item(item: Item, fields: Sequence[str] = ITEM_FIELDS) -> dict[str, Any]:
     # Services return plain dicts; Pydantic validates them at the API layer via
     # response_model. Build the dict explicitly instead of relying on from_attributes.
-    return {
-        "id": item.id,
-        "name": item.name,
-        "description": item.description,
-        "summary": item.summary,
-        "status": item.status,
-        "created_at": item.created_at,
-        "updated_at": item.updated_at,
-    }
+    return {field: getattr(item, field) for field in fields}
+
+
+def serialize_row(row: Row[Any], fields: Sequence[str] = ITEM_FIELDS) -> dict[str, Any]:
+    # Core-path sibling of serialize_item: rows from crud.list_item_rows hold the
+    # fields positionally, in this order (extra trailing columns are ignored).
+    return dict(zip(fields, row, strict=False))
+
+
+def parse_item_fields(fields: str | None) -> tuple[str, ...] | None:
+    # `?fields=name,status` → the requested subset of ITEM_FIELDS in canonical order;
+    # id is always included. None (no param) means every field.
+    if fields is None:
+        return None
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    if not requested or not requested <= set(ITEM_FIELDS):
+        raise_bad_request("invalid_fields")
+    return tuple(field for field in ITEM_FIELDS if field == "id" or field in requested)
+
+
+def item_etag(item_id: uuid.UUID, updated_at: datetime) -> str:
+    # Strong validator: every write bumps updated_at (onupdate), so (id, updated_at)
+    # identifies the representation without hashing the body.
+    return make_etag(item_id, updated_at.astimezone(UTC).isoformat())
+
+
+def encode_item_cursor(item: Item | Row[Any]) -> str:
+    return encode_cursor(item.created_at.isoformat(), str(item.id))
+
+
+def decode_item_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    created_at, item_id = decode_cursor(cursor, size=2)
+    try:
+        return datetime.fromisoformat(created_at), uuid.UUID(item_id)
+    except ValueError:
+        raise_bad_request("invalid_cursor")
+
+
+def encode_search_cursor(rank: float, item_id: uuid.UUID) -> str:
+    # repr() is the shortest string that parses back to the same float; crud casts it
+    # back to real so the keyset comparison sees the stored rank.
+    return encode_cursor(repr(rank), str(item_id))
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    rank, item_id = decode_cursor(cursor, size=2)
+    try:
+        return float(rank), uuid.UUID(item_id)
+    except ValueError:
+        raise_bad_request("invalid_cursor")
@@ -1,25 +1,61 @@
 import math
+from collections.abc import Sequence
 from typing import Any
 
-from app.features.items.service.helpers import serialize_item
+from app.core.pagination import TotalMode
+from app.features.items.service.helpers import ITEM_FIELDS, decode_item_cursor, encode_item_cursor, serialize_row
 from app.repositories.items import crud
-from app.services.base import Service
+from app.services.base import ReadService
 
 
-class ListItemsService(Service):
-    async def call(self, *, page: int, page_size: int, status: str | None = None) -> dict[str, Any]:
-        items, total_count = await crud.list_items_with_count(
+class ListItemsService(ReadService):
+    # Two modes on one endpoint: page/page_size (OFFSET) for existing clients, and
+    # keyset mode once the client sends back a `next_cursor`. Every page carries
+    # `next_cursor`, so a client can switch modes after the first page. Totals come
+    # from the maintained counters (or planner estimates) and can be skipped.
+    async def call(
+        self,
+        *,
+        page: int,
+        page_size: int,
+        status: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
+        total_mode: TotalMode = "exact",
+        fields: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        # Read-only listing: Core rows of just the needed columns (the requested
+        # fields, plus created_at for the cursor) — no ORM entities are built, and
+        # the unbounded Text columns stay in the table unless asked for.
+        fields = tuple(fields) if fields is not None else ITEM_FIELDS
+        columns = fields if "created_at" in fields else (*fields, "created_at")
+        # Fetch one extra row to learn whether another page exists without a count.
+        rows = await crud.list_item_rows(
             self.db,
-            limit=page_size,
+            columns=columns,
+            limit=page_size + 1,
             offset=(page - 1) * page_size,
+            after=decode_item_cursor(cursor) if cursor is not None else None,
             status=status,
         )
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        total_count = await self._total_count(status=status, total_mode=total_mode) if include_total else None
         return {
             "data": {
-                "items": [serialize_item(item) for item in items],
-                "page": page,
+                "items": [serialize_row(row, fields) for row in rows],
+                "page": page if cursor is None else None,
                 "page_size": page_size,
                 "total_count": total_count,
-                "total_pages": math.ceil(total_count / page_size) if total_count > 0 else 0,
+                "total_pages": math.ceil(total_count / page_size) if total_count is not None else None,
+                "next_cursor": encode_item_cursor(rows[-1]) if has_more else None,
             }
         }
+
+    async def _total_count(self, *, status: str | None, total_mode: TotalMode) -> int:
+        if total_mode == "estimated":
+            estimate = await crud.estimate_item_count(self.db, status=status)
+            if estimate is not None:
+                return estimate
+        return await crud.count_items(self.db, status=status)
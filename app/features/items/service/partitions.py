@@ -0,0 +1,78 @@
+from datetime import date
+
+from psycopg.errors import LockNotAvailable
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import database_config
+from app.core.logger import log
+from app.repositories.items import cache as item_cache
+from app.repositories.items import partitions
+from app.services.base import Service
+from app.utils.time import utc_now
+
+INVALIDATE_CHUNK_SIZE = 1000
+
+
+class MaintainItemPartitionsService(Service):
+    # Periodic (cron) service behind tasks.item_partitions. Idempotent: creates the
+    # current and next ITEMS_PARTITION_PREMAKE_MONTHS monthly partitions, then retires
+    # those past retention. Each DETACH commits in a short transaction of its own;
+    # if it cannot get its locks within ITEMS_PARTITION_LOCK_TIMEOUT_MS the run stops
+    # there and the next run retries. Once the DETACH has committed no query can
+    # re-cache the partition's rows, so they are invalidated then — before the DROP,
+    # or before a kept table is marked retired. A run that dies in between leaves the
+    # table detached but unfinished; the next run finishes it first.
+    async def call(self, *, today: date | None = None) -> dict:
+        this_month = (today or utc_now().date()).replace(day=1)
+        months = [_add_months(this_month, n) for n in range(database_config.ITEMS_PARTITION_PREMAKE_MONTHS + 1)]
+        ensured = await partitions.ensure_item_partitions(self.db, months)
+        await self.db.commit()
+
+        retired = await self._retire_expired(this_month)
+        log.info("item_partitions_maintained", ensured=ensured, retired=retired)
+        return {"ensured": ensured, "retired": retired}
+
+    async def _retire_expired(self, this_month: date) -> list[str]:
+        if database_config.ITEMS_RETENTION_MONTHS is None:
+            return []
+        cutoff = _add_months(this_month, -database_config.ITEMS_RETENTION_MONTHS)
+        retired = []
+        for partition in await partitions.list_unfinished_item_partitions(self.db):
+            if partition.month >= cutoff:
+                continue
+            log.warning("item_partition_retire_resumed", partition=partition.name)
+            await self._finish_retiring(partition)
+            retired.append(partition.name)
+
+        for partition in await partitions.list_item_partitions(self.db):
+            if partition.month >= cutoff:
+                break
+            try:
+                await partitions.detach_item_partition(
+                    self.db, partition, lock_timeout_ms=database_config.ITEMS_PARTITION_LOCK_TIMEOUT_MS
+                )
+            except DBAPIError as exc:
+                if not isinstance(exc.orig, LockNotAvailable):
+                    raise
+                await self.db.rollback()
+                log.warning("item_partition_retire_deferred", partition=partition.name, reason="lock_timeout")
+                break
+            await self.db.commit()
+            await self._finish_retiring(partition)
+            retired.append(partition.name)
+        return retired
+
+    async def _finish_retiring(self, partition: partitions.ItemPartition) -> None:
+        # Safe to repeat: invalidation is idempotent and the DROP / mark commits last.
+        async for item_ids in partitions.item_ids_in_partition(self.db, partition, chunk_size=INVALIDATE_CHUNK_SIZE):
+            await item_cache.invalidate_items(*item_ids)
+        if database_config.ITEMS_RETENTION_ACTION == "drop":
+            await partitions.drop_item_partition(self.db, partition)
+        else:
+            await partitions.mark_item_partition_retired(self.db, partition)
+        await self.db.commit()
+
+
+def _add_months(month: date, n: int) -> date:
+    years, month_index = divmod(month.month - 1 + n, 12)
+    return date(month.year + years, month_index + 1, 1)
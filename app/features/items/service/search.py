@@ -0,0 +1,39 @@
+from typing import Any
+
+from app.features.items.service.helpers import decode_search_cursor, encode_search_cursor, serialize_item
+from app.repositories.items import crud
+from app.services.base import ReadService
+
+
+class SearchItemsService(ReadService):
+    # Ranked full-text search, keyset-paginated only: there is no total, and a page
+    # number over a relevance order would shift as rows are written.
+    async def call(
+        self,
+        *,
+        query: str,
+        page_size: int,
+        cursor: str | None = None,
+        status: str | None = None,
+    ) -> dict[str, Any]:
+        rows = await crud.search_items(
+            self.db,
+            query=query,
+            limit=page_size + 1,
+            after=decode_search_cursor(cursor) if cursor is not None else None,
+            status=status,
+        )
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        next_cursor = None
+        if has_more:
+            last_item, last_rank = rows[-1]
+            next_cursor = encode_search_cursor(last_rank, last_item.id)
+        return {
+            "data": {
+                "items": [serialize_item(item) for item, _rank in rows],
+                "page_size": page_size,
+                "next_cursor": next_cursor,
+            }
+        }
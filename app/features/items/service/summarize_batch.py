@@ -0,0 +1,48 @@
+import asyncio
+from uuid import UUID
+
+from app.core.config import ai_config
+from app.core.logger import log
+from app.features.items.agents.summarizer import summarize_text
+from app.repositories.items import crud
+from app.services.base import Service
+
+
+class SummarizeItemsService(Service):
+    # Batch sibling of SummarizeItemService (runs via Celery `summarize_items_task`):
+    # one query loads every item, the model calls run concurrently (at most
+    # AI_BATCH_CONCURRENCY at a time), and one UPDATE writes the summaries back.
+    # Same idempotency rules per item; async_db_session commits the write.
+    async def call(self, item_ids: list[str]) -> dict:
+        requested = list(dict.fromkeys(item_ids))
+        items = await crud.get_items_by_ids(self.db, [UUID(item_id) for item_id in requested])
+        # Idempotent per item, as in SummarizeItemService: missing, empty and already
+        # summarized items are skipped.
+        pending = [(item.id, item.description) for item in items if item.description and item.summary is None]
+        # Hand the connection back to the pool for the model calls — they take far
+        # longer than any query.
+        await self.db.commit()
+
+        semaphore = asyncio.Semaphore(ai_config.AI_BATCH_CONCURRENCY)
+
+        async def summarize(description: str) -> str:
+            async with semaphore:
+                return (await summarize_text(description)).summary
+
+        # One failed call must not sink the batch: the others are still written, and
+        # the failed ids are reported for the caller to re-enqueue.
+        results = await asyncio.gather(*(summarize(description) for _, description in pending), return_exceptions=True)
+        summaries: dict[UUID, str] = {}
+        failed: list[str] = []
+        for (item_id, _), result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException):
+                log.warning("summarize_item_failed", item_id=str(item_id), error=str(result))
+                failed.append(str(item_id))
+            else:
+                summaries[item_id] = result
+
+        summarized = [str(item_id) for item_id in await crud.set_item_summaries(self.db, summaries)]
+        done = {*summarized, *failed}
+        skipped = [item_id for item_id in requested if item_id not in done]
+        log.info("summarize_items_completed", summarized=len(summarized), skipped=len(skipped), failed=len(failed))
+        return {"summarized": summarized, "skipped": skipped, "failed": failed}
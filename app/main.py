@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Response
@@ -8,6 +9,7 @@ from app.core.exceptions import setup_exception_handlers
 from app.core.logger import setup_logging
 from app.core.security import setup_security_middleware
 from app.integrations.sentry.client import init_sentry
+from app.workers.publisher import task_publisher
 
 setup_logging()
 init_sentry()
@@ -18,7 +20,11 @@ async def lifespan(_: FastAPI):
     # uvicorn applies its own dictConfig after import time, clobbering our handlers —
     # re-run here to restore the unified format for uvicorn's own loggers.
     setup_logging()
+    # Async routes enqueue through the background publisher (app/workers/publisher.py);
+    # on shutdown it flushes what is buffered before the process exits.
+    task_publisher.start()
     yield
+    await asyncio.to_thread(task_publisher.stop)
 
 
 app = FastAPI(
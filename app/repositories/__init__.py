@@ -1,5 +1,5 @@
-from app.repositories.items.models import Item
+from app.repositories.items.models import Item, ItemCount
 
 # Every model must be imported here so Base.metadata is fully populated (Alembic
 # autogenerate and the test schema builder both rely on it). Add new models below.
-__all__ = ["Item"]
+__all__ = ["Item", "ItemCount"]
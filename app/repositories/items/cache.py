@@ -0,0 +1,49 @@
+import json
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic_core import to_json
+
+from app.core.cache import cache_fill, cache_get, cache_invalidate
+from app.repositories.items.models import Item
+
+# Redis representation of a single item for crud.get_item_by_id_cached. Bump the
+# version in the key prefix whenever the cached column set changes.
+ITEM_CACHE_PREFIX = "item:v1:"
+CACHED_COLUMNS = ("id", "name", "description", "summary", "status", "created_at", "updated_at")
+
+
+def item_cache_key(item_id: uuid.UUID) -> str:
+    return f"{ITEM_CACHE_PREFIX}{item_id}"
+
+
+def item_values(item: Item) -> dict[str, Any]:
+    return {column: getattr(item, column) for column in CACHED_COLUMNS}
+
+
+def dump_item(item: Item) -> str:
+    return to_json(item_values(item)).decode("utf-8")
+
+
+def load_item(raw: str) -> Item:
+    # Rebuilt as a transient (session-less) Item: fine for reading and serializing,
+    # never pass it to a write — load the row through the session for that.
+    values = json.loads(raw)
+    values["id"] = uuid.UUID(values["id"])
+    values["created_at"] = datetime.fromisoformat(values["created_at"])
+    values["updated_at"] = datetime.fromisoformat(values["updated_at"])
+    return Item(**values)
+
+
+async def get_cached_item(item_id: uuid.UUID) -> Item | None:
+    raw = await cache_get(item_cache_key(item_id))
+    return load_item(raw) if raw is not None else None
+
+
+async def cache_item(item: Item) -> None:
+    await cache_fill(item_cache_key(item.id), dump_item(item))
+
+
+async def invalidate_items(*item_ids: uuid.UUID) -> None:
+    await cache_invalidate(*(item_cache_key(item_id) for item_id in item_ids))
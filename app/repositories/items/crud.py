@@ -1,12 +1,24 @@
 import uuid
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import REAL, Row, Text, any_, cast, func, insert, literal, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.repositories.items.models import Item
+from app.core.config import cache_config
+from app.core.db.replicas import primary_session
+from app.core.singleflight import single_flight
+from app.repositories.items import cache as item_cache
+from app.repositories.items.models import ITEM_SEARCH_CONFIG, Item, ItemCount
+from app.utils.time import utc_now
 
 # Repository functions never commit — they flush to materialize IDs/defaults. The
 # transaction belongs to the caller (route service commits; Celery auto-commits).
+# Every function that modifies existing rows must invalidate them in item_cache
+# (archive_stale_items, which runs in caller-committed chunks, leaves that to its
+# caller).
 
 
 async def create_item(db: AsyncSession, *, name: str, description: str | None = None) -> Item:
@@ -16,31 +28,276 @@ async def create_item(db: AsyncSession, *, name: str, description: str | None =
     return item
 
 
+async def create_items(db: AsyncSession, *, items: Sequence[dict[str, Any]]) -> list[Item]:
+    # Bulk sibling of create_item for ingest routes and workers: one INSERT ...
+    # VALUES (...), (...) RETURNING per insertmanyvalues batch instead of a flush per
+    # row. Python-side defaults (uuid7 id, timestamps) still apply to every row, and
+    # rows come back in input order.
+    if not items:
+        return []
+    stmt = insert(Item).returning(Item, sort_by_parameter_order=True)
+    return list((await db.scalars(stmt, list(items))).all())
+
+
+# Lookups by id alone cannot prune partitions — created_at is the partition key —
+# so they probe the primary-key index of every attached partition (one cheap index
+# probe each; retention keeps the count bounded). A created_at bound derived from the
+# UUIDv7 id would prune, but rows given an explicit created_at (imports, backfills)
+# don't carry their id's timestamp, so it is not applied.
 async def get_item_by_id(db: AsyncSession, item_id: uuid.UUID) -> Item | None:
     result = await db.execute(select(Item).where(Item.id == item_id))
     return result.scalar_one_or_none()
 
 
-async def list_items_with_count(
+async def get_items_by_ids(db: AsyncSession, item_ids: Sequence[uuid.UUID]) -> list[Item]:
+    # One round trip for many ids. `id = ANY(:ids)` binds a single uuid[] parameter,
+    # so the statement text (and plan) is the same whatever the list length — unlike
+    # IN (...), which renders one placeholder per id. Rows come back in no particular
+    # order; callers re-order by id.
+    if not item_ids:
+        return []
+    stmt = select(Item).where(Item.id == any_(literal(list(item_ids), ARRAY(UUID(as_uuid=True)))))
+    return list((await db.execute(stmt)).scalars().all())
+
+
+async def get_item_by_id_cached(db: AsyncSession, item_id: uuid.UUID) -> Item | None:
+    # Read-through Redis cache for hot single-item reads. On a miss, concurrent
+    # callers for the same id share one database load (single flight). Always returns
+    # a transient Item — read-only use; writers must load through get_item_by_id.
+    item = await item_cache.get_cached_item(item_id)
+    if item is not None:
+        return item
+    values = await _item_loads.do(item_id, lambda: _load_item_values(db, item_id))
+    return Item(**values) if values is not None else None
+
+
+_item_loads = single_flight("items.get_item_by_id")
+
+
+async def _load_item_values(db: AsyncSession, item_id: uuid.UUID) -> dict[str, Any] | None:
+    # Plain values, not the ORM instance: the result is shared with callers on other
+    # sessions, and each builds its own Item from it.
+    #
+    # Only primary reads fill the cache. A replica lagging by more than
+    # CACHE_TOMBSTONE_SECONDS would re-cache the row as it was before the last write,
+    # for the whole CACHE_TTL_SECONDS. So with caching on, a miss on a replica read
+    # session loads through the request's primary session (a miss costs a primary
+    # read, a hit no read at all); without one it is served from the replica, uncached.
+    primary = primary_session(db) if cache_config.CACHE_ENABLED else None
+    item = await get_item_by_id(primary or db, item_id)
+    if item is None:
+        return None
+    if primary is not None:
+        await item_cache.cache_item(item)
+    return item_cache.item_values(item)
+
+
+async def get_item_updated_at(db: AsyncSession, item_id: uuid.UUID) -> datetime | None:
+    # Version probe for conditional GETs: the cached copy when warm, otherwise a
+    # primary-key lookup of one timestamp that never reads the Text columns.
+    cached = await item_cache.get_cached_item(item_id)
+    if cached is not None:
+        return cached.updated_at
+    return (await db.execute(select(Item.updated_at).where(Item.id == item_id))).scalar_one_or_none()
+
+
+async def list_items(
     db: AsyncSession,
     *,
     limit: int,
     offset: int,
     status: str | None = None,
-) -> tuple[list[Item], int]:
-    # Window function gets the total count in the same query — no second round-trip.
-    total_count_expr = func.count().over().label("total_count")
-    stmt = select(Item, total_count_expr).order_by(Item.created_at.desc()).limit(limit).offset(offset)
+) -> list[Item]:
+    # ORM-entity listing, kept as the baseline for scripts/bench_item_reads.py; the
+    # app lists through list_item_rows.
+    stmt = select(Item).order_by(Item.created_at.desc(), Item.id.desc()).limit(limit).offset(offset)
+    if status is not None:
+        stmt = stmt.where(Item.status == status)
+
+    return list((await db.execute(stmt)).scalars().all())
+
+
+async def stream_items(
+    db: AsyncSession,
+    *,
+    columns: Sequence[str],
+    chunk_size: int,
+    status: str | None = None,
+) -> AsyncIterator[Sequence[Row]]:
+    # Server-side cursor (psycopg named cursor) fetched chunk_size rows at a time.
+    # Plain column rows, not ORM entities — nothing accumulates in the identity map,
+    # so memory stays flat however many rows the table holds.
+    stmt = (
+        select(*(getattr(Item, column) for column in columns))
+        .order_by(Item.created_at, Item.id)
+        .execution_options(yield_per=chunk_size)
+    )
     if status is not None:
         stmt = stmt.where(Item.status == status)
 
-    rows = (await db.execute(stmt)).all()
-    if not rows:
-        return [], 0
-    return [row[0] for row in rows], rows[0][1]
+    result = await db.stream(stmt)
+    async for rows in result.partitions():
+        yield rows
+
+
+async def count_items(db: AsyncSession, *, status: str | None = None) -> int:
+    # Exact and O(1): sums the trigger-maintained item_counts shards (see models.py)
+    # instead of a count(*) / count() OVER () scan of the filtered set.
+    stmt = select(func.coalesce(func.sum(ItemCount.count), 0))
+    if status is not None:
+        stmt = stmt.where(ItemCount.status == status)
+    return int((await db.execute(stmt)).scalar_one())
+
+
+async def estimate_item_count(db: AsyncSession, *, status: str | None = None) -> int | None:
+    # Planner statistics: reltuples of items (and any partitions), scaled by the
+    # status column's most-common-value frequency. Free, but only as fresh as the
+    # last (auto)ANALYZE. None when there are no usable stats (never analyzed, or
+    # the status is not among the column's most-common values).
+    reltuples = (
+        await db.execute(
+            text(
+                "SELECT sum(reltuples) FILTER (WHERE reltuples >= 0) FROM pg_class "
+                "WHERE oid = 'public.items'::regclass "
+                "OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = 'public.items'::regclass)"
+            )
+        )
+    ).scalar_one()
+    if reltuples is None:
+        return None
+    if status is None:
+        return int(reltuples)
+
+    stats = (
+        await db.execute(
+            text(
+                "SELECT most_common_vals::text::text[] AS vals, most_common_freqs AS freqs FROM pg_stats "
+                "WHERE schemaname = 'public' AND tablename = 'items' AND attname = 'status' "
+                "ORDER BY inherited DESC LIMIT 1"
+            )
+        )
+    ).first()
+    if stats is None or stats.vals is None or status not in stats.vals:
+        return None
+    return round(reltuples * stats.freqs[stats.vals.index(status)])
+
+
+async def list_item_rows(
+    db: AsyncSession,
+    *,
+    columns: Sequence[str],
+    limit: int,
+    offset: int = 0,
+    after: tuple[datetime, uuid.UUID] | None = None,
+    status: str | None = None,
+) -> Sequence[Row[Any]]:
+    # Core read path for read-only listings: the named columns come back as plain
+    # Row tuples — no Item instances, identity map or attribute instrumentation.
+    # Newest first. `after` is keyset (seek) pagination: a row-value comparison on
+    # (created_at, id) walks the items_created_at_id_idx index from the last row
+    # seen, so deep pages cost the same as the first one (OFFSET reads and discards
+    # every skipped row).
+    stmt = (
+        select(*(getattr(Item, column) for column in columns))
+        .order_by(Item.created_at.desc(), Item.id.desc())
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Item.created_at, Item.id) < tuple_(literal(after[0]), literal(after[1])))
+    elif offset:
+        stmt = stmt.offset(offset)
+    if status is not None:
+        stmt = stmt.where(Item.status == status)
+
+    return (await db.execute(stmt)).all()
+
+
+async def search_items(
+    db: AsyncSession,
+    *,
+    query: str,
+    limit: int,
+    after: tuple[float, uuid.UUID] | None = None,
+    status: str | None = None,
+) -> list[tuple[Item, float]]:
+    # `@@` on the generated search_vector is answered by items_search_vector_idx
+    # (GIN); only matching rows are ranked. Keyset on (rank, id): rank is a float4,
+    # so the cursor value is cast back to real — compared as float8 it would never
+    # equal the stored rank and pages would repeat.
+    ts_query = func.websearch_to_tsquery(ITEM_SEARCH_CONFIG, query)
+    rank = func.ts_rank(Item.search_vector, ts_query, type_=REAL)
+    stmt = (
+        select(Item, rank.label("rank"))
+        .where(Item.search_vector.bool_op("@@")(ts_query))
+        .order_by(rank.desc(), Item.id.desc())
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(rank, Item.id) < tuple_(cast(literal(after[0]), REAL), literal(after[1])))
+    if status is not None:
+        stmt = stmt.where(Item.status == status)
+
+    return [(row.Item, row.rank) for row in await db.execute(stmt)]
+
+
+async def archive_stale_items(
+    db: AsyncSession,
+    *,
+    stale_before: datetime,
+    limit: int,
+    after: tuple[datetime, uuid.UUID] | None = None,
+) -> list[tuple[datetime, uuid.UUID]]:
+    # One archival chunk: flips up to `limit` active items not updated since
+    # stale_before, walking the active partial index in (created_at, id) order from
+    # `after`. FOR UPDATE SKIP LOCKED passes over rows a request is writing instead of
+    # waiting on them (a later pass picks them up). Returns the archived (created_at,
+    # id) keys; the caller commits, so row locks live for one chunk only, and then
+    # invalidates them in item_cache — invalidating before the commit would let a
+    # concurrent read re-cache the pre-archive row.
+    batch = (
+        select(Item.id, Item.created_at)
+        .where(Item.status == "active", Item.created_at < stale_before, Item.updated_at < stale_before)
+        .order_by(Item.created_at, Item.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    if after is not None:
+        batch = batch.where(tuple_(Item.created_at, Item.id) > tuple_(literal(after[0]), literal(after[1])))
+    batch = batch.cte("batch")
+    stmt = (
+        update(Item)
+        .where(Item.id == batch.c.id, Item.created_at == batch.c.created_at)
+        .values(status="archived", updated_at=utc_now())
+        .returning(Item.created_at, Item.id)
+        .execution_options(synchronize_session=False)
+    )
+    return [(row.created_at, row.id) for row in await db.execute(stmt)]
 
 
 async def set_item_summary(db: AsyncSession, item: Item, summary: str) -> Item:
     item.summary = summary
     await db.flush()
+    await item_cache.invalidate_items(item.id)
     return item
+
+
+async def set_item_summaries(db: AsyncSession, summaries: Mapping[uuid.UUID, str]) -> list[uuid.UUID]:
+    # Bulk sibling of set_item_summary: one UPDATE ... FROM unnest(ids, summaries) for
+    # the whole batch. Only rows still without a summary are written, so a concurrent
+    # (re-)delivery that got there first wins. Returns the ids actually updated.
+    if not summaries:
+        return []
+    rows = select(
+        func.unnest(literal(list(summaries), ARRAY(UUID(as_uuid=True)))).label("id"),
+        func.unnest(literal(list(summaries.values()), ARRAY(Text))).label("summary"),
+    ).subquery("summaries")
+    stmt = (
+        update(Item)
+        .where(Item.id == rows.c.id, Item.summary.is_(None))
+        .values(summary=rows.c.summary, updated_at=utc_now())
+        .returning(Item.id)
+        .execution_options(synchronize_session=False)
+    )
+    updated = list((await db.execute(stmt)).scalars().all())
+    await item_cache.invalidate_items(*updated)
+    return updated
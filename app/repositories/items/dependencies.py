@@ -12,7 +12,9 @@ from app.repositories.items.models import Item
 async def valid_item_id(item_id: UUID, db: AsyncDb) -> Item:
     # Dependency-as-validation: every route with {item_id} reuses this to load the
     # item and 404 if missing — no repeated existence checks in each endpoint.
-    item = await crud.get_item_by_id(db, item_id)
+    # Returns a transient Item (read-only): Redis when warm, otherwise one DB load
+    # shared by concurrent requests for the same id.
+    item = await crud.get_item_by_id_cached(db, item_id)
     if item is None:
         raise_not_found("item_not_found")
     return item
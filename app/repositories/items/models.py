@@ -1,8 +1,20 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    CheckConstraint,
+    Computed,
+    DateTime,
+    Index,
+    SmallInteger,
+    String,
+    Text,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db import Base
@@ -14,12 +26,35 @@ from app.utils.uuid import uuid7
 
 VALID_ITEM_STATUSES = ("active", "archived")
 
+# Text search configuration of items.search_vector; queries must use the same one.
+ITEM_SEARCH_CONFIG = "english"
+# name ranks above description, description above summary (ts_rank weights A/B/C).
+ITEM_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{ITEM_SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector('{ITEM_SEARCH_CONFIG}', coalesce(description, '')), 'B') || "
+    f"setweight(to_tsvector('{ITEM_SEARCH_CONFIG}', coalesce(summary, '')), 'C')"
+)
+
 
 class Item(Base):
     __tablename__ = "items"
     __table_args__ = (
         CheckConstraint("status IN ('active', 'archived')", name="status"),
-        {"schema": "public"},
+        # Keyset pagination seeks on (created_at, id) — see crud.list_item_rows.
+        Index("items_created_at_id_idx", "created_at", "id"),
+        # One partial index per status so ?status= listings range-scan only that
+        # status's rows in (created_at, id) order.
+        *(
+            Index(
+                f"items_{status}_created_at_id_idx", "created_at", "id", postgresql_where=text(f"status = '{status}'")
+            )
+            for status in VALID_ITEM_STATUSES
+        ),
+        # Full-text search — see crud.search_items.
+        Index("items_search_vector_idx", "search_vector", postgresql_using="gin"),
+        # Monthly range partitions on created_at (see partitions.py): retention drops
+        # whole partitions instead of DELETEing rows.
+        {"schema": "public", "postgresql_partition_by": "RANGE (created_at)"},
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
@@ -27,7 +62,162 @@ class Item(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="active")
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=utc_now)
+    # Part of the table's primary key only because Postgres requires the partition key
+    # in every unique constraint; the ORM identifies items by id alone (mapper args).
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, nullable=False, default=utc_now
+    )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=utc_now, onupdate=utc_now
     )
+    # Generated by Postgres from name/description/summary, so it can never drift from
+    # them. Deferred: only search queries read it.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(ITEM_SEARCH_VECTOR_SQL, persisted=True), deferred=True
+    )
+
+    # Don't RETURNING the generated search_vector on every INSERT/UPDATE; it stays
+    # expired until a search query asks for it. (Unannotated: DeclarativeBase already
+    # types __mapper_args__, and a ClassVar annotation conflicts with it.)
+    __mapper_args__ = {"eager_defaults": False, "primary_key": [id]}  # noqa: RUF012
+
+
+class ItemCount(Base):
+    # Per-status row counts kept in step with `items` by the statement-level triggers
+    # below, in the same transaction as the write — totals cost a read of a few
+    # rows instead of a scan. Each status is spread over ITEM_COUNT_SHARDS rows
+    # (picked by backend pid) so concurrent writers don't queue on one hot row;
+    # readers sum the shards.
+    __tablename__ = "item_counts"
+    __table_args__ = ({"schema": "public"},)
+
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+ITEM_COUNT_SHARDS = 16
+
+# Kept in sync with alembic/versions/*_0003_item_counts.py; attached to the table's
+# after_create so Base.metadata.create_all (the test schema builder) installs them too.
+ITEM_COUNT_TRIGGERS_DDL = (
+    f"""
+    CREATE OR REPLACE FUNCTION public.items_count_rows() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'TRUNCATE' THEN
+            DELETE FROM public.item_counts;
+        ELSIF TG_OP = 'INSERT' THEN
+            INSERT INTO public.item_counts AS c (status, shard, count)
+            SELECT status, mod(pg_backend_pid(), {ITEM_COUNT_SHARDS}), count(*)
+            FROM new_rows GROUP BY status ORDER BY status
+            ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count;
+        ELSIF TG_OP = 'DELETE' THEN
+            INSERT INTO public.item_counts AS c (status, shard, count)
+            SELECT status, mod(pg_backend_pid(), {ITEM_COUNT_SHARDS}), -count(*)
+            FROM old_rows GROUP BY status ORDER BY status
+            ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count;
+        ELSE
+            INSERT INTO public.item_counts AS c (status, shard, count)
+            SELECT status, mod(pg_backend_pid(), {ITEM_COUNT_SHARDS}), sum(delta)
+            FROM (
+                SELECT o.status, -1 AS delta FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE o.status <> n.status
+                UNION ALL
+                SELECT n.status, 1 AS delta FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE o.status <> n.status
+            ) moved
+            GROUP BY status ORDER BY status
+            ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    """
+    CREATE TRIGGER items_count_insert AFTER INSERT ON public.items
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+    """,
+    """
+    CREATE TRIGGER items_count_update AFTER UPDATE ON public.items
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+    """,
+    """
+    CREATE TRIGGER items_count_delete AFTER DELETE ON public.items
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+    """,
+    """
+    CREATE TRIGGER items_count_truncate AFTER TRUNCATE ON public.items
+    FOR EACH STATEMENT EXECUTE FUNCTION public.items_count_rows()
+    """,
+)
+
+for _statement in ITEM_COUNT_TRIGGERS_DDL:
+    event.listen(Item.__table__, "after_create", DDL(_statement))
+
+# Kept in sync with alembic/versions/*_0006_items_partitioned.py and *_0007_*.py.
+# Maintenance (see partitions.py) creates future months through the same function.
+ITEM_PARTITIONS_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION public.items_ensure_partition(month date) RETURNS text
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        first_day timestamp := date_trunc('month', month::timestamp);
+        partition_name text := 'items_p' || to_char(first_day, 'YYYY_MM');
+        -- Bounds are UTC month starts, whatever the session's TimeZone.
+        lower_bound timestamptz := first_day AT TIME ZONE 'UTC';
+        upper_bound timestamptz := (first_day + interval '1 month') AT TIME ZONE 'UTC';
+        stranded boolean;
+    BEGIN
+        IF to_regclass(format('public.%I', partition_name)) IS NOT NULL THEN
+            RETURN partition_name;
+        END IF;
+        -- Rows of this month already in items_default (maintenance fell behind, or a
+        -- future created_at) would make the CREATE fail its check against the
+        -- default. Park them, create the partition, and insert them back. Both
+        -- statements go through items, so the count triggers cancel out.
+        PERFORM 1 FROM public.items WHERE created_at >= lower_bound AND created_at < upper_bound LIMIT 1;
+        stranded := FOUND;
+        IF stranded THEN
+            CREATE TEMP TABLE items_stranded ON COMMIT DROP AS
+                SELECT id, name, description, summary, status, created_at, updated_at
+                FROM public.items WITH NO DATA;
+            WITH moved AS (
+                DELETE FROM public.items WHERE created_at >= lower_bound AND created_at < upper_bound
+                RETURNING id, name, description, summary, status, created_at, updated_at
+            )
+            INSERT INTO items_stranded SELECT * FROM moved;
+        END IF;
+        EXECUTE format(
+            'CREATE TABLE public.%I PARTITION OF public.items FOR VALUES FROM (%L) TO (%L)',
+            partition_name,
+            lower_bound,
+            upper_bound
+        );
+        IF stranded THEN
+            INSERT INTO public.items (id, name, description, summary, status, created_at, updated_at)
+            SELECT id, name, description, summary, status, created_at, updated_at FROM items_stranded;
+            DROP TABLE items_stranded;
+        END IF;
+        RETURN partition_name;
+    END;
+    $$
+    """,
+    # Catches rows outside every monthly partition (maintenance stopped running, or a
+    # backdated or future created_at). items_ensure_partition moves a month's rows
+    # out when it creates that month; only months that never get one stay here.
+    "CREATE TABLE IF NOT EXISTS public.items_default PARTITION OF public.items DEFAULT",
+    """
+    SELECT public.items_ensure_partition(
+        (date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => n))::date
+    )
+    FROM generate_series(0, 2) AS n
+    """,
+)
+
+for _statement in ITEM_PARTITIONS_DDL:
+    # DDL() %-formats its text; format()'s %I / %L must reach Postgres intact.
+    event.listen(Item.__table__, "after_create", DDL(_statement.replace("%", "%%")))
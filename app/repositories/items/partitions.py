@@ -0,0 +1,116 @@
+import re
+import uuid
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import Date, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Monthly range partitions of `items` (see models.ITEM_PARTITIONS_DDL). Partitions
+# are named items_pYYYY_MM after the UTC month they hold; items_default catches the
+# rest. Like crud.py, nothing here commits.
+#
+# Detaching a partition bypasses the row triggers that keep item_counts exact, so
+# detach_item_partition subtracts the partition's counts itself. Its items stay in
+# item_cache until the caller invalidates them (item_ids_in_partition, after the
+# DETACH has committed and before any DROP). A kept (not dropped) detached table is
+# then marked retired; list_unfinished_item_partitions finds detached ones that are
+# neither dropped nor marked, so a retirement cut short can be finished.
+
+_PARTITION_NAME = re.compile(r"^items_p(\d{4})_(\d{2})$")
+# Table comment on a detached partition whose retirement finished.
+_RETIRED = "items: retired"
+
+
+@dataclass(frozen=True)
+class ItemPartition:
+    name: str
+    month: date
+
+
+async def list_item_partitions(db: AsyncSession) -> list[ItemPartition]:
+    names = await db.scalars(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'public.items'::regclass"
+        )
+    )
+    return _parse_partitions(names)
+
+
+async def list_unfinished_item_partitions(db: AsyncSession) -> list[ItemPartition]:
+    # Detached items_pYYYY_MM tables not (yet) marked by mark_item_partition_retired.
+    names = await db.scalars(
+        text(
+            "SELECT c.relname FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = 'public' AND c.relkind = 'r' AND c.relname ~ '^items_p[0-9]{4}_[0-9]{2}$' "
+            "AND NOT c.relispartition "
+            "AND obj_description(c.oid, 'pg_class') IS DISTINCT FROM :retired"
+        ),
+        {"retired": _RETIRED},
+    )
+    return _parse_partitions(names)
+
+
+async def ensure_item_partitions(db: AsyncSession, months: Sequence[date]) -> list[str]:
+    # Idempotent; returns the partition names. A month whose rows already sit in
+    # items_default gets them moved into its new partition.
+    stmt = text("SELECT public.items_ensure_partition(month) FROM unnest(:months) AS month").bindparams(
+        bindparam("months", type_=ARRAY(Date))
+    )
+    return list(await db.scalars(stmt, {"months": list(months)}))
+
+
+async def detach_item_partition(db: AsyncSession, partition: ItemPartition, *, lock_timeout_ms: int) -> None:
+    # DETACH is a catalog change: no row is deleted, so no bloat and no vacuum work.
+    # The SHARE lock holds writers to this one partition off while its rows are
+    # counted; the DETACH itself takes ACCESS EXCLUSIVE on items. lock_timeout bounds
+    # how long either waits (e.g. behind a streaming export) — every item query
+    # queued behind the pending lock would wait with it. A timeout raises
+    # LockNotAvailable; the caller rolls back and tries again on its next run.
+    name = _checked_name(partition)
+    await db.execute(text(f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}"))
+    await db.execute(text(f"LOCK TABLE public.{name} IN SHARE MODE"))
+    await db.execute(
+        text(
+            "INSERT INTO public.item_counts AS c (status, shard, count) "
+            f"SELECT status, 0, -count(*) FROM public.{name} GROUP BY status ORDER BY status "
+            "ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count"
+        )
+    )
+    await db.execute(text(f"ALTER TABLE public.items DETACH PARTITION public.{name}"))
+
+
+async def item_ids_in_partition(
+    db: AsyncSession, partition: ItemPartition, *, chunk_size: int
+) -> AsyncIterator[list[uuid.UUID]]:
+    # Streams a (detached) partition's ids in chunks through a server-side cursor.
+    name = _checked_name(partition)
+    result = await db.stream_scalars(text(f"SELECT id FROM public.{name}").execution_options(yield_per=chunk_size))
+    async for chunk in result.partitions():
+        yield list(chunk)
+
+
+async def drop_item_partition(db: AsyncSession, partition: ItemPartition) -> None:
+    await db.execute(text(f"DROP TABLE public.{_checked_name(partition)}"))
+
+
+async def mark_item_partition_retired(db: AsyncSession, partition: ItemPartition) -> None:
+    await db.execute(text(f"COMMENT ON TABLE public.{_checked_name(partition)} IS '{_RETIRED}'"))
+
+
+def _parse_partitions(names: Iterable[str]) -> list[ItemPartition]:
+    partitions = []
+    for name in names:
+        if match := _PARTITION_NAME.match(name):
+            partitions.append(ItemPartition(name=name, month=date(int(match[1]), int(match[2]), 1)))
+    return sorted(partitions, key=lambda partition: partition.month)
+
+
+def _checked_name(partition: ItemPartition) -> str:
+    # Names are interpolated into DDL; only ever items_pYYYY_MM.
+    if not _PARTITION_NAME.match(partition.name):
+        raise ValueError(f"not an items month partition: {partition.name!r}")
+    return partition.name
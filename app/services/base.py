@@ -1,6 +1,19 @@
-from app.core.db import AsyncDb
+from app.core.db import AsyncDb, AsyncReadDb, AsyncSnapshotReadDb
 
 
 class Service:
     def __init__(self, db: AsyncDb):
         self.db = db
+
+
+class ReadService:
+    # For read-only services: self.db may be a replica session (see AsyncReadDb).
+    def __init__(self, db: AsyncReadDb):
+        self.db = db
+
+
+class SnapshotReadService(ReadService):
+    # Read-only, but inside a transaction block — for streamed results and reads
+    # whose statements must see one snapshot (see AsyncSnapshotReadDb).
+    def __init__(self, db: AsyncSnapshotReadDb):
+        self.db = db
@@ -3,9 +3,10 @@ import sys
 from celery import Celery
 from celery.schedules import crontab
 from celery.signals import setup_logging as celery_setup_logging
-from celery.signals import task_prerun
+from celery.signals import task_postrun, task_prerun
 
 from app.core.config import celery_config, database_config
+from app.core.db.instrumentation import check_query_budget, current_query_stats, start_query_stats, stop_query_stats
 from app.core.logger import bind_context, clear_context, setup_logging
 from app.integrations.sentry.client import init_sentry
 
@@ -36,6 +37,16 @@ def _bind_task_context(task_id=None, task=None, **_):
         ctx["queue"] = queue
     if ctx:
         bind_context(**ctx)
+    start_query_stats()
+
+
+# Per-task query budget report (see app/core/db/instrumentation.py).
+@task_postrun.connect
+def _check_task_query_budget(task=None, **_):
+    stats = current_query_stats()
+    stop_query_stats()
+    if stats is not None:
+        check_query_budget(stats, scope=f"task {getattr(task, 'name', 'unknown')}")
 
 
 celery = Celery(
@@ -59,7 +70,13 @@ celery.conf.update(
     task_time_limit=celery_config.TASK_TIME_LIMIT,
     task_soft_time_limit=int(celery_config.TASK_TIME_LIMIT * 0.8),
     worker_prefetch_multiplier=1,
-    worker_concurrency=celery_config.WORKER_CONCURRENCY,
+    # asyncio mode: Celery's thread pool feeds one shared event loop (runner.py).
+    worker_pool="threads" if celery_config.WORKER_POOL == "asyncio" else "prefork",
+    worker_concurrency=(
+        celery_config.WORKER_ASYNC_CONCURRENCY
+        if celery_config.WORKER_POOL == "asyncio"
+        else celery_config.WORKER_CONCURRENCY
+    ),
     worker_max_tasks_per_child=celery_config.WORKER_MAX_TASKS_PER_CHILD,
     # Broker resilience: surface a dead peer in ~90s (vs the kernel's multi-minute
     # default), health-check every 30s, and retry forever.
@@ -77,6 +94,12 @@ celery.conf.update(
             "task": "tasks.example_cleanup",
             "schedule": crontab(hour=3, minute=0),  # 3 AM UTC daily
         },
+        # Creates upcoming items partitions well before they are needed and applies
+        # ITEMS_RETENTION_MONTHS (see app/features/items/service/partitions.py).
+        "item-partitions": {
+            "task": "tasks.item_partitions",
+            "schedule": crontab(hour=2, minute=30),  # 2:30 AM UTC daily
+        },
         # Per-queue liveness probes — one per worker queue. A missed Sentry Cron
         # check-in means that queue's worker is down or wedged.
         "heartbeat-default": {"task": "tasks.heartbeat_default", "schedule": crontab(minute="*/5")},
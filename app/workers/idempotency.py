@@ -1,8 +1,77 @@
+import hashlib
+import time
 import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 
+from app.core.config import celery_config
 from app.core.db.async_ import async_redis
 
+# Delivery idempotency for tasks that must not run twice (acks_late + re-delivery).
+#
+#   claim = await claim_delivery("email", dedup_key)   # atomic SET NX with a lease
+#   if claim is None: return                            # delivered, or running elsewhere
+#   try: ... do the work ...
+#   except Exception: await release_delivery(claim); raise   # let a retry claim it
+#   await confirm_delivery(claim)                       # marker lives for 24h
+#
+# A claim is a lease, not a lock held forever: if the worker dies, the claim expires
+# after CLAIM_LEASE_SECONDS and a re-delivery can claim it again. Confirm and release
+# only act while the caller still holds its own claim (compare-and-set in Lua).
+# The plural variants (claim_deliveries, ...) pipeline a whole batch into one round trip.
+#
+# Marker store (CeleryConfig.IDEMPOTENCY_MARKER_STORE):
+# - keys:  the claim key itself becomes the 24h "done" marker — exact.
+# - bloom: confirmed deliveries set bits in hourly Bloom-filter bitmaps — fixed memory
+#   however many markers, but a small false-positive rate (a task wrongly seen as
+#   delivered is skipped). Claims stay short-lived keys.
+
 DELIVERY_MARKER_TTL_SECONDS = 24 * 60 * 60
+# Outlives any task's hard time limit, so a running task never loses its claim.
+CLAIM_LEASE_SECONDS = celery_config.TASK_TIME_LIMIT + 60
+
+BLOOM_BUCKET_SECONDS = 60 * 60
+_BLOOM_WINDOW = DELIVERY_MARKER_TTL_SECONDS // BLOOM_BUCKET_SECONDS + 1
+
+_DONE = "done"
+
+# KEYS[1] claim/marker key; ARGV[1] claim value, ARGV[2] done value, ARGV[3] marker TTL
+_confirm_marker = async_redis.register_script(
+    """
+    if redis.call('GET', KEYS[1]) ~= ARGV[1] then return 0 end
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+    """
+)
+# KEYS[1] claim key, KEYS[2] bloom bucket; ARGV[1] claim value, ARGV[2] bucket TTL,
+# ARGV[3..] bit offsets
+_confirm_bloom = async_redis.register_script(
+    """
+    if redis.call('GET', KEYS[1]) ~= ARGV[1] then return 0 end
+    for i = 3, #ARGV do redis.call('SETBIT', KEYS[2], ARGV[i], 1) end
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+    redis.call('DEL', KEYS[1])
+    return 1
+    """
+)
+# KEYS[1] claim key; ARGV[1] claim value
+_release = async_redis.register_script(
+    """
+    if redis.call('GET', KEYS[1]) ~= ARGV[1] then return 0 end
+    return redis.call('DEL', KEYS[1])
+    """
+)
+
+
+@dataclass(frozen=True)
+class Claim:
+    kind: str
+    dedup_key: str
+    token: str
+
+    @property
+    def value(self) -> str:
+        return f"claimed:{self.token}"
 
 
 def new_dedup_key() -> str:
@@ -13,9 +82,139 @@ def _marker(kind: str, dedup_key: str) -> str:
     return f"task_delivered:{kind}:{dedup_key}"
 
 
+def _claim_key(kind: str, dedup_key: str) -> str:
+    if celery_config.IDEMPOTENCY_MARKER_STORE == "bloom":
+        return f"task_claim:{kind}:{dedup_key}"
+    return _marker(kind, dedup_key)
+
+
+async def claim_delivery(kind: str, dedup_key: str, *, lease_seconds: int = CLAIM_LEASE_SECONDS) -> Claim | None:
+    return (await claim_deliveries(kind, [dedup_key], lease_seconds=lease_seconds))[dedup_key]
+
+
+async def claim_deliveries(
+    kind: str, dedup_keys: Sequence[str], *, lease_seconds: int = CLAIM_LEASE_SECONDS
+) -> dict[str, Claim | None]:
+    # None for keys already delivered or claimed by someone else.
+    claims = {key: Claim(kind, key, uuid.uuid4().hex) for key in dict.fromkeys(dedup_keys)}
+    if not claims:
+        return {}
+    if celery_config.IDEMPOTENCY_MARKER_STORE == "bloom":
+        return await _claim_deliveries_bloom(kind, claims, lease_seconds)
+
+    async with async_redis.pipeline(transaction=False) as pipe:
+        for key, claim in claims.items():
+            pipe.set(_marker(kind, key), claim.value, nx=True, ex=lease_seconds)
+        acquired = await pipe.execute()
+    return {key: claim if ok else None for (key, claim), ok in zip(claims.items(), acquired, strict=True)}
+
+
+async def confirm_delivery(claim: Claim) -> bool:
+    return (await confirm_deliveries([claim]))[0]
+
+
+async def confirm_deliveries(claims: Sequence[Claim]) -> list[bool]:
+    # False where the claim was lost (lease expired and re-claimed) — the work ran
+    # twice; tasks must still converge in that case.
+    if not claims:
+        return []
+    bucket = _bloom_bucket(int(time.time()) // BLOOM_BUCKET_SECONDS)
+    async with async_redis.pipeline(transaction=False) as pipe:
+        for claim in claims:
+            key = _claim_key(claim.kind, claim.dedup_key)
+            if celery_config.IDEMPOTENCY_MARKER_STORE == "bloom":
+                offsets = _bloom_offsets(claim.kind, claim.dedup_key)
+                ttl = _BLOOM_WINDOW * BLOOM_BUCKET_SECONDS
+                await _confirm_bloom(keys=[key, bucket], args=[claim.value, ttl, *offsets], client=pipe)
+            else:
+                await _confirm_marker(keys=[key], args=[claim.value, _DONE, DELIVERY_MARKER_TTL_SECONDS], client=pipe)
+        return [bool(ok) for ok in await pipe.execute()]
+
+
+async def release_delivery(claim: Claim) -> bool:
+    return (await release_deliveries([claim]))[0]
+
+
+async def release_deliveries(claims: Sequence[Claim]) -> list[bool]:
+    # Gives a failed attempt's claims back so a retry / re-delivery can take them.
+    if not claims:
+        return []
+    async with async_redis.pipeline(transaction=False) as pipe:
+        for claim in claims:
+            await _release(keys=[_claim_key(claim.kind, claim.dedup_key)], args=[claim.value], client=pipe)
+        return [bool(ok) for ok in await pipe.execute()]
+
+
 async def is_already_delivered(kind: str, dedup_key: str) -> bool:
-    return bool(await async_redis.exists(_marker(kind, dedup_key)))
+    return (await check_deliveries(kind, [dedup_key]))[dedup_key]
+
+
+async def check_deliveries(kind: str, dedup_keys: Sequence[str]) -> dict[str, bool]:
+    # Read-only batch check (confirmed deliveries only; live claims count as not
+    # delivered). Prefer claim_deliveries before doing the work — a check leaves
+    # the race window open.
+    keys = list(dict.fromkeys(dedup_keys))
+    if not keys:
+        return {}
+    if celery_config.IDEMPOTENCY_MARKER_STORE == "bloom":
+        async with async_redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                _queue_bloom_lookup(pipe, kind, key)
+            replies = await pipe.execute()
+        return {key: _bloom_hit(replies[i * _BLOOM_WINDOW : (i + 1) * _BLOOM_WINDOW]) for i, key in enumerate(keys)}
+    values = await async_redis.mget([_marker(kind, key) for key in keys])
+    # Anything but a live claim is a confirmed marker, including the "1" older
+    # releases wrote before claims existed.
+    return {
+        key: value is not None and not value.startswith("claimed:") for key, value in zip(keys, values, strict=True)
+    }
+
+
+async def _claim_deliveries_bloom(kind: str, claims: dict[str, Claim], lease_seconds: int) -> dict[str, Claim | None]:
+    # One MULTI: the Bloom lookups and the SET NX claims run atomically, so a
+    # concurrent confirm (Lua, also atomic) is seen either entirely or not at all.
+    async with async_redis.pipeline(transaction=True) as pipe:
+        for key, claim in claims.items():
+            _queue_bloom_lookup(pipe, kind, key)
+            pipe.set(_claim_key(kind, key), claim.value, nx=True, ex=lease_seconds)
+        replies = await pipe.execute()
+
+    result: dict[str, Claim | None] = {}
+    stale: list[Claim] = []
+    step = _BLOOM_WINDOW + 1
+    for i, (key, claim) in enumerate(claims.items()):
+        delivered = _bloom_hit(replies[i * step : i * step + _BLOOM_WINDOW])
+        acquired = bool(replies[i * step + _BLOOM_WINDOW])
+        if delivered and acquired:
+            stale.append(claim)
+        result[key] = claim if acquired and not delivered else None
+    if stale:
+        await release_deliveries(stale)
+    return result
+
+
+def _queue_bloom_lookup(pipe, kind: str, dedup_key: str) -> None:
+    # One BITFIELD GET per hourly bucket in the marker window.
+    offsets = _bloom_offsets(kind, dedup_key)
+    current = int(time.time()) // BLOOM_BUCKET_SECONDS
+    for bucket in range(current - _BLOOM_WINDOW + 1, current + 1):
+        operation = pipe.bitfield(_bloom_bucket(bucket))
+        for offset in offsets:
+            operation.get("u1", offset)
+        operation.execute()
+
+
+def _bloom_hit(bucket_replies: Iterable[Sequence[int]]) -> bool:
+    return any(all(bits) for bits in bucket_replies)
+
+
+def _bloom_bucket(bucket: int) -> str:
+    return f"task_delivered_bloom:{bucket}"
 
 
-async def mark_delivered(kind: str, dedup_key: str) -> None:
-    await async_redis.set(_marker(kind, dedup_key), "1", ex=DELIVERY_MARKER_TTL_SECONDS)
+def _bloom_offsets(kind: str, dedup_key: str) -> list[int]:
+    # Double hashing (Kirsch-Mitzenmacher): k offsets from one 128-bit digest.
+    digest = hashlib.blake2b(f"{kind}:{dedup_key}".encode(), digest_size=16).digest()
+    h1, h2 = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big") | 1
+    bits = celery_config.IDEMPOTENCY_BLOOM_BITS
+    return [(h1 + i * h2) % bits for i in range(celery_config.IDEMPOTENCY_BLOOM_HASHES)]
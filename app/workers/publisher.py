@@ -0,0 +1,201 @@
+import asyncio
+import contextlib
+import queue
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from celery import Celery, Task
+from kombu import Connection
+
+from app.core.config import celery_config
+from app.core.logger import log
+from app.workers.celery import celery
+
+# Non-blocking task enqueue for the API process. task.delay() is a synchronous broker
+# publish; called from an async route it stalls the event loop — and every in-flight
+# request — for as long as the broker takes to answer.
+#
+# TaskPublisher hands messages to one background thread that owns its own broker
+# connection (not the shared producer pool) and publishes in micro-batches: it waits
+# up to TASK_PUBLISH_LINGER_MS for more messages, then sends up to
+# TASK_PUBLISH_BATCH_SIZE of them over that one connection. At most
+# TASK_PUBLISH_CAPACITY messages are buffered or in flight; beyond that publish()
+# waits up to TASK_ENQUEUE_TIMEOUT_SECONDS for room, then raises TaskQueueFull so a
+# broker outage surfaces as backpressure instead of unbounded memory.
+#
+# publish() returns once the message is buffered, not when the broker has it, so a
+# failed publish cannot be raised to the caller. After Celery's own retries it is
+# logged (task_publish_failed) and sent again on a fresh connection, up to
+# TASK_PUBLISH_RETRIES times; a message that still fails is dropped, logged as an
+# error (task_publish_dropped) and counted in publisher_stats().dropped — alert on
+# that. Started/stopped by the app lifespan; when it is not running (tests,
+# scripts, workers) publish() falls back to task.delay() on a thread.
+
+
+class TaskQueueFull(Exception):
+    pass
+
+
+@dataclass
+class PublisherStats:
+    # Each counter is written by one thread only (the event loop or the publisher).
+    enqueued: int = 0
+    rejected: int = 0
+    published: int = 0
+    # Publish attempts that raised; each is retried on a fresh connection or dropped.
+    failed: int = 0
+    retried: int = 0
+    dropped: int = 0
+    batches: int = 0
+    # Time publish() kept its caller waiting for buffer room.
+    enqueue_wait_total: float = 0.0
+    enqueue_wait_max: float = 0.0
+    # Time from publish() to the broker accepting the message.
+    publish_lag_total: float = 0.0
+    publish_lag_max: float = 0.0
+
+
+@dataclass(frozen=True)
+class _Message:
+    task: Task
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    enqueued_at: float
+    attempts: int = 0
+
+
+@dataclass
+class TaskPublisher:
+    app: Celery
+    stats: PublisherStats = field(default_factory=PublisherStats)
+    # None is the stop sentinel.
+    _buffer: queue.Queue[_Message | None] = field(default_factory=queue.Queue, repr=False)
+    _slots: asyncio.Semaphore | None = field(default=None, repr=False)
+    _loop: asyncio.AbstractEventLoop | None = field(default=None, repr=False)
+    _thread: threading.Thread | None = field(default=None, repr=False)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def buffered(self) -> int:
+        return self._buffer.qsize()
+
+    def start(self) -> None:
+        # Call from the event loop that will call publish().
+        if self._thread is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(celery_config.TASK_PUBLISH_CAPACITY)
+        self._thread = threading.Thread(target=self._run, name="task-publisher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        # Publishes what is already buffered, then closes the connection. Blocking.
+        if self._thread is None:
+            return
+        self._buffer.put(None)
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            log.warning("task_publisher_stop_timeout", buffered=self.buffered)
+        self._thread = self._slots = self._loop = None
+
+    async def publish(self, task: Task, *args: Any, **kwargs: Any) -> None:
+        if self._slots is None:
+            await asyncio.to_thread(task.delay, *args, **kwargs)
+            return
+
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), celery_config.TASK_ENQUEUE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            self.stats.rejected += 1
+            log.warning("task_enqueue_rejected", task=task.name, buffered=self.buffered)
+            raise TaskQueueFull(task.name) from None
+        waited = time.perf_counter() - started
+        self.stats.enqueued += 1
+        self.stats.enqueue_wait_total += waited
+        self.stats.enqueue_wait_max = max(self.stats.enqueue_wait_max, waited)
+        if waited * 1000 >= celery_config.TASK_ENQUEUE_SLOW_MS:
+            log.warning("task_enqueue_slow", task=task.name, wait_ms=round(waited * 1000, 1), buffered=self.buffered)
+        self._buffer.put(_Message(task, args, kwargs, started))
+
+    def _run(self) -> None:
+        connection: Connection | None = None
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            while batch:
+                if connection is None:
+                    connection = self._connect()
+                batch = self._publish_batch(connection, batch)
+                if batch:
+                    # Drop a connection that failed mid-batch; retries go out on a new one.
+                    connection.release()
+                    connection = None
+        if connection is not None:
+            connection.release()
+
+    def _connect(self) -> Connection:
+        return self.app.connection_for_write()
+
+    def _next_batch(self) -> tuple[list[_Message], bool]:
+        first = self._buffer.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.perf_counter() + celery_config.TASK_PUBLISH_LINGER_MS / 1000
+        while len(batch) < celery_config.TASK_PUBLISH_BATCH_SIZE:
+            try:
+                message = self._buffer.get(timeout=max(deadline - time.perf_counter(), 0))
+            except queue.Empty:
+                break
+            if message is None:
+                return batch, True
+            batch.append(message)
+        return batch, False
+
+    def _publish_batch(self, connection: Connection, batch: list[_Message]) -> list[_Message]:
+        # Returns the messages to retry on a fresh connection.
+        retry: list[_Message] = []
+        producer = self.app.amqp.Producer(connection)
+        self.stats.batches += 1
+        for message in batch:
+            try:
+                message.task.apply_async(message.args, message.kwargs, producer=producer)
+            except Exception as exc:
+                self.stats.failed += 1
+                log.warning("task_publish_failed", task=message.task.name, attempt=message.attempts + 1, error=str(exc))
+                if message.attempts < celery_config.TASK_PUBLISH_RETRIES:
+                    self.stats.retried += 1
+                    retry.append(replace(message, attempts=message.attempts + 1))
+                    continue
+                self.stats.dropped += 1
+                log.error("task_publish_dropped", task=message.task.name, attempts=message.attempts + 1)
+            else:
+                lag = time.perf_counter() - message.enqueued_at
+                self.stats.published += 1
+                self.stats.publish_lag_total += lag
+                self.stats.publish_lag_max = max(self.stats.publish_lag_max, lag)
+                if lag * 1000 >= celery_config.TASK_ENQUEUE_SLOW_MS:
+                    log.warning("task_publish_slow", task=message.task.name, lag_ms=round(lag * 1000, 1))
+            # Published or dropped: the message no longer holds a buffer slot.
+            self._release_slot()
+        return retry
+
+    def _release_slot(self) -> None:
+        loop, slots = self._loop, self._slots
+        if loop is None or slots is None:
+            return
+        with contextlib.suppress(RuntimeError):  # loop already closed at shutdown
+            loop.call_soon_threadsafe(slots.release)
+
+
+task_publisher = TaskPublisher(celery)
+
+
+def publisher_stats() -> PublisherStats:
+    return task_publisher.stats
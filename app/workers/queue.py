@@ -1,9 +1,36 @@
-from app.workers.registry import summarize_item_task
+from app.workers.publisher import TaskQueueFull, task_publisher
+from app.workers.registry import summarize_item_task, summarize_items_task
 
 # Public API to enqueue tasks from application code. Feature services import these
 # helpers — never call task.delay() / task.apply_async() directly from feature code.
 # When you add a task, add a typed enqueue_<task_name> helper here.
+#
+# From async code (routes, async services) use the *_async variants: they hand the
+# message to the background publisher instead of publishing on the event loop, and
+# raise TaskQueueFull when its buffer stays full (broker down or too slow).
+
+__all__ = [
+    "SUMMARIZE_BATCH_SIZE",
+    "TaskQueueFull",
+    "enqueue_summarize_item",
+    "enqueue_summarize_item_async",
+    "enqueue_summarize_items",
+]
 
 
 def enqueue_summarize_item(item_id: str) -> None:
     summarize_item_task.delay(item_id)  # type: ignore[attr-defined]
+
+
+async def enqueue_summarize_item_async(item_id: str) -> None:
+    await task_publisher.publish(summarize_item_task, item_id)  # type: ignore[arg-type]
+
+
+# Ids per tasks.summarize_items message: large enough to keep AI_BATCH_CONCURRENCY
+# model calls busy, small enough to finish well inside the task's time limit.
+SUMMARIZE_BATCH_SIZE = 50
+
+
+def enqueue_summarize_items(item_ids: list[str]) -> None:
+    for start in range(0, len(item_ids), SUMMARIZE_BATCH_SIZE):
+        summarize_items_task.delay(item_ids[start : start + SUMMARIZE_BATCH_SIZE])  # type: ignore[attr-defined]
@@ -17,15 +17,31 @@ def summarize_item_task(item_id: str) -> dict:
     return run_service(SummarizeItemService, item_id)
 
 
+@celery.task(name="tasks.summarize_items", queue=QUEUE_HEAVY, max_retries=1, time_limit=600)
+def summarize_items_task(item_ids: list[str]) -> dict:
+    from app.features.items.service.summarize_batch import SummarizeItemsService
+
+    bind_context(item_count=len(item_ids))
+    return run_service(SummarizeItemsService, item_ids)
+
+
 @celery.task(name="tasks.example_cleanup", queue=QUEUE_DEFAULT, time_limit=300, max_retries=0)
 def example_cleanup_task() -> dict:
-    # Idempotent cron — beat fires again next interval, so max_retries=0. Replace
-    # the service with your own periodic job (see .claude/rules/backend/background.md).
+    # Idempotent cron — beat fires again next interval, so max_retries=0. Archives
+    # stale items within ITEMS_ARCHIVE_TIME_BUDGET_SECONDS (keep it under time_limit).
     from app.features.items.service.cleanup import CleanupItemsService
 
     return run_service(CleanupItemsService)
 
 
+@celery.task(name="tasks.item_partitions", queue=QUEUE_DEFAULT, time_limit=300, max_retries=0)
+def item_partitions_task() -> dict:
+    # Idempotent cron: creates upcoming monthly items partitions, retires expired ones.
+    from app.features.items.service.partitions import MaintainItemPartitionsService
+
+    return run_service(MaintainItemPartitionsService)
+
+
 # Liveness probes — one per worker queue. Bodies are pure on purpose (no DB/Redis)
 # so the probe tests only "is this worker pulling and running tasks".
 @celery.task(name="tasks.heartbeat_default", queue=QUEUE_DEFAULT, max_retries=0, time_limit=30)
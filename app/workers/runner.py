@@ -1,30 +1,155 @@
 import asyncio
+import concurrent.futures
+import contextvars
+import threading
 from collections.abc import Coroutine
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
-from celery.signals import worker_process_init, worker_process_shutdown
+from celery import Task, current_task
+from celery.exceptions import SoftTimeLimitExceeded, TimeLimitExceeded
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown, worker_shutdown
+
+from app.core.config import celery_config
 
 T = TypeVar("T")
 
+# Two execution modes (CeleryConfig.WORKER_POOL):
+#
+# - prefork: every pool child runs one task at a time on its own asyncio.Runner.
+# - asyncio: one process, Celery's thread pool with WORKER_ASYNC_CONCURRENCY threads,
+#   and ONE event loop in a background thread. Each pool thread hands its task's
+#   coroutine to the loop and blocks on the result, so that many tasks await I/O
+#   concurrently in one process. acks_late is unchanged (Celery acks when the thread
+#   returns). The thread pool enforces no time limits, so run_async applies the
+#   task's soft limit as a cancellation inside the loop and the hard limit as a
+#   timeout on the wait.
+#
+# Either way the coroutine runs in a copy of the calling thread's context, so what
+# task_prerun bound (structlog task context, query stats) is visible inside it and
+# private to that task.
+
 _runner: asyncio.Runner | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
 
 
 def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    context = contextvars.copy_context()
+    if _loop is not None:
+        return _run_on_shared_loop(coro, context)
     if _runner is None:
         raise RuntimeError("async runner not initialized — is this running inside a Celery worker?")
-    return _runner.run(coro)
+    return _runner.run(coro, context=context)
 
 
 def run_service(service_cls: type, *args, **kwargs):
     from app.core.db.async_ import async_db_session
 
     async def _run():
+        # One session (and transaction) per task, in both modes.
         async with async_db_session() as db:
             return await service_cls(db).call(*args, **kwargs)
 
     return run_async(_run())
 
 
+def _run_on_shared_loop(coro: Coroutine[Any, Any, T], context: contextvars.Context) -> T:
+    assert _loop is not None
+    loop = _loop
+    hard_limit, soft_limit = _time_limits()
+    done: concurrent.futures.Future[T] = concurrent.futures.Future()
+    started: list[asyncio.Task[T]] = []
+
+    def start() -> None:
+        task = loop.create_task(_with_soft_limit(coro, soft_limit), context=context)
+        started.append(task)
+        task.add_done_callback(lambda finished: _copy_outcome(finished, done))
+
+    loop.call_soon_threadsafe(start)
+    try:
+        return done.result(timeout=hard_limit)
+    except concurrent.futures.TimeoutError:
+        if started:
+            loop.call_soon_threadsafe(started[0].cancel)
+        raise TimeLimitExceeded(hard_limit) from None
+
+
+async def _with_soft_limit(coro: Coroutine[Any, Any, T], soft_limit: float | None) -> T:
+    if soft_limit is None:
+        return await coro
+    scope = asyncio.timeout(soft_limit)
+    try:
+        async with scope:
+            return await coro
+    except TimeoutError:
+        if scope.expired():
+            raise SoftTimeLimitExceeded(soft_limit) from None
+        raise
+
+
+def _copy_outcome(task: asyncio.Task[T], done: concurrent.futures.Future[T]) -> None:
+    if task.cancelled():
+        done.cancel()
+    elif (exc := task.exception()) is not None:
+        done.set_exception(exc)
+    else:
+        done.set_result(task.result())
+
+
+def _time_limits() -> tuple[float | None, float | None]:
+    # Same precedence as prefork: per-call limits, then the task's, then the app's.
+    if not current_task:
+        return None, None
+    task = cast(Task, current_task)  # proxy to the task running on this thread
+    hard, soft = task.request.timelimit or (None, None)
+    hard = hard or task.time_limit or task.app.conf.task_time_limit
+    soft = soft or task.soft_time_limit or task.app.conf.task_soft_time_limit
+    if hard and soft:
+        soft = min(soft, hard)
+    return hard, soft
+
+
+def start_shared_loop() -> None:
+    global _loop, _loop_thread
+    if _loop is not None:
+        return
+    loop = asyncio.new_event_loop()
+    _loop_thread = threading.Thread(target=loop.run_forever, name="async-tasks", daemon=True)
+    _loop_thread.start()
+    _loop = loop
+
+
+def stop_shared_loop() -> None:
+    global _loop, _loop_thread
+    if _loop is None or _loop_thread is None:
+        return
+    _loop.call_soon_threadsafe(_loop.stop)
+    _loop_thread.join(timeout=30)
+    _loop.close()
+    _loop = _loop_thread = None
+
+
+@worker_init.connect
+def setup_shared_loop(**kwargs):
+    # asyncio mode runs no child processes, so worker_process_init never fires.
+    if celery_config.WORKER_POOL == "asyncio":
+        start_shared_loop()
+
+
+@worker_shutdown.connect
+def cleanup_shared_loop(**kwargs):
+    if _loop is None:
+        return
+    from app.core.db.async_ import async_engine, async_redis
+
+    async def _close_clients() -> None:
+        await async_engine.dispose()
+        await async_redis.aclose()
+
+    run_async(_close_clients())
+    stop_shared_loop()
+
+
 @worker_process_init.connect
 def setup_async_runner(**kwargs):
     global _runner
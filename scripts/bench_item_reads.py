@@ -0,0 +1,84 @@
+"""Micro-benchmark: ORM vs Core read paths for item listings and exports.
+
+Seeds rows inside a transaction that is rolled back at the end, so it can run
+against a dev database without leaving data behind:
+
+    uv run python -m scripts.bench_item_reads --rows 20000
+
+Reports rows/sec for one page (page sizes 10/50/100) and for a full export,
+each measured as query + serialization to the dicts the API encodes.
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import select
+
+from app.core.db import AsyncSessionLocal
+from app.features.items.service.helpers import ITEM_FIELDS, serialize_item, serialize_row
+from app.repositories.items import crud
+from app.repositories.items.models import Item
+
+PAGE_SIZES = (10, 50, 100)
+
+
+async def _rate(label: str, repeat: int, run: Callable[[], Awaitable[int]]) -> None:
+    await run()  # warm up: statement cache, pool connection
+    rows = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        rows += await run()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {rows / elapsed:>12,.0f} rows/s  ({elapsed / repeat * 1000:.2f} ms/call)")
+
+
+async def main(total_rows: int, repeat: int) -> None:
+    async with AsyncSessionLocal() as db, db.begin():
+        await crud.create_items(
+            db, items=[{"name": f"bench {i}", "description": "x" * 200, "summary": None} for i in range(total_rows)]
+        )
+        db.expunge_all()
+
+        for page_size in PAGE_SIZES:
+
+            async def orm_page(page_size: int = page_size) -> int:
+                items = await crud.list_items(db, limit=page_size, offset=0)
+                payload = [serialize_item(item) for item in items]
+                db.expunge_all()  # a request starts with an empty identity map
+                return len(payload)
+
+            async def core_page(page_size: int = page_size) -> int:
+                rows = await crud.list_item_rows(db, columns=ITEM_FIELDS, limit=page_size)
+                return len([serialize_row(row) for row in rows])
+
+            await _rate(f"page {page_size:>3} ORM", repeat, orm_page)
+            await _rate(f"page {page_size:>3} Core", repeat, core_page)
+
+        async def orm_export() -> int:
+            count = 0
+            async for partition in (await db.stream(select(Item).execution_options(yield_per=1000))).partitions():
+                count += len([serialize_item(item) for (item,) in partition])
+            db.expunge_all()
+            return count
+
+        async def core_export() -> int:
+            count = 0
+            async for partition in crud.stream_items(db, columns=ITEM_FIELDS, chunk_size=1000):
+                count += len([serialize_row(row) for row in partition])
+            return count
+
+        export_repeat = max(1, repeat // 100)
+        await _rate("export ORM", export_repeat, orm_export)
+        await _rate("export Core", export_repeat, core_export)
+
+        await db.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000, help="rows to seed (rolled back afterwards)")
+    parser.add_argument("--repeat", type=int, default=300, help="calls per page measurement")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,125 @@
+"""Benchmark: prefork vs asyncio worker modes on an I/O-bound task.
+
+Starts a real Celery worker per mode against the configured Redis and Postgres,
+enqueues --tasks tasks that each run one query and then await --latency seconds
+(standing in for a Bedrock call), and waits for all of them to finish:
+
+    uv run python -m scripts.bench_worker_modes --tasks 400 --latency 1.0
+
+Reports tasks/sec, the worker's memory (PSS summed over the worker process and its
+children, so pages shared after fork are not counted twice) and tasks/sec per GB.
+Both modes run with the same number of task slots (--slots).
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import redis
+from sqlalchemy import text
+
+from app.core.config import database_config
+from app.workers.celery import celery
+from app.workers.runner import run_async
+
+BENCH_QUEUE = "bench"
+DONE_KEY = "bench:worker_modes:done"
+
+
+@celery.task(name="bench.io_task", queue=BENCH_QUEUE, acks_late=True)
+def io_task(latency: float) -> None:
+    from app.core.db.async_ import async_db_session
+
+    async def _body() -> None:
+        async with async_db_session() as db:
+            await db.execute(text("SELECT 1"))
+        await asyncio.sleep(latency)
+
+    run_async(_body())
+    redis.Redis.from_url(database_config.REDIS_URL).incr(DONE_KEY)
+
+
+def _pss_kib(pid: int) -> int:
+    # Proportional set size of pid and all its descendants (Linux only).
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            for line in Path(f"/proc/{current}/smaps_rollup").read_text().splitlines():
+                if line.startswith("Pss:"):
+                    total += int(line.split()[1])
+            for task in Path(f"/proc/{current}/task").iterdir():
+                pending.extend(int(child) for child in (task / "children").read_text().split())
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+    return total
+
+
+def _done(client: redis.Redis) -> int:
+    value = client.get(DONE_KEY)
+    return int(value) if isinstance(value, bytes) else 0
+
+
+def _run_mode(mode: str, slots: int, tasks: int, latency: float) -> None:
+    client = redis.Redis.from_url(database_config.REDIS_URL)
+    client.delete(DONE_KEY, BENCH_QUEUE)
+    env = {
+        **os.environ,
+        "WORKER_POOL": mode,
+        "WORKER_CONCURRENCY": str(slots),
+        "WORKER_ASYNC_CONCURRENCY": str(slots),
+        "POOL_SIZE": str(max(slots, 5)),
+    }
+    command = [sys.executable, "-m", "celery", "-A", "scripts.bench_worker_modes:celery", "worker"]
+    worker = subprocess.Popen(
+        [
+            *command,
+            "-Q",
+            BENCH_QUEUE,
+            "--loglevel=warning",
+            "--without-heartbeat",
+            "--without-gossip",
+            "--without-mingle",
+        ],
+        env=env,
+    )
+    try:
+        time.sleep(5)  # let the pool start
+        for _ in range(tasks):
+            io_task.delay(latency)  # type: ignore[attr-defined]
+        started = time.perf_counter()
+        peak_kib = 0
+        while _done(client) < tasks:
+            peak_kib = max(peak_kib, _pss_kib(worker.pid))
+            time.sleep(0.2)
+        elapsed = time.perf_counter() - started
+    finally:
+        worker.send_signal(signal.SIGTERM)
+        worker.wait(timeout=60)
+
+    rate = tasks / elapsed
+    gib = peak_kib / (1024 * 1024)
+    print(
+        f"{mode:<8} {slots:>3} slots {rate:>10,.1f} tasks/s "
+        f"{peak_kib / 1024:>9,.0f} MiB {rate / gib:>12,.1f} tasks/s/GiB"
+    )
+
+
+def main(slots: int, tasks: int, latency: float) -> None:
+    for mode in ("prefork", "asyncio"):
+        _run_mode(mode, slots, tasks, latency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slots", type=int, default=8, help="concurrent tasks per worker (processes or loop slots)")
+    parser.add_argument("--tasks", type=int, default=400, help="tasks to run per mode")
+    parser.add_argument("--latency", type=float, default=1.0, help="simulated I/O wait per task, in seconds")
+    args = parser.parse_args()
+    main(args.slots, args.tasks, args.latency)
@@ -0,0 +1,105 @@
+import zlib
+
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import GzipEncoder, negotiate_encoding
+from app.core.security import COMPRESSION_MIN_SIZE, CompressionMiddleware
+
+_LARGE = "x" * (COMPRESSION_MIN_SIZE * 4)
+
+
+async def _large(request):
+    return JSONResponse({"data": _LARGE}, headers={"ETag": '"abc"'})
+
+
+async def _small(request):
+    return PlainTextResponse("ok")
+
+
+async def _image(request):
+    return Response(b"\x89PNG" + b"0" * COMPRESSION_MIN_SIZE * 4, media_type="image/png")
+
+
+async def _stream(request):
+    async def rows():
+        for i in range(50):
+            yield f'{{"row": {i}, "pad": "{"y" * 100}"}}\n'
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
+_app = CompressionMiddleware(
+    Starlette(
+        routes=[
+            Route("/large", _large),
+            Route("/small", _small),
+            Route("/image", _image),
+            Route("/stream", _stream),
+        ]
+    )
+)
+
+
+async def _get(path: str, accept_encoding: str = "gzip"):
+    async with AsyncClient(transport=ASGITransport(app=_app), base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+class TestCompressionMiddleware:
+    async def test_compresses_large_body_and_weakens_etag(self):
+        response = await _get("/large")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"abc"'
+        assert int(response.headers["content-length"]) < len(_LARGE)
+        assert response.json() == {"data": _LARGE}
+
+    async def test_small_body_passes_through(self):
+        response = await _get("/small")
+
+        assert "content-encoding" not in response.headers
+        assert response.text == "ok"
+
+    async def test_skips_already_compressed_media(self):
+        response = await _get("/image")
+
+        assert "content-encoding" not in response.headers
+
+    async def test_skips_when_client_does_not_accept(self):
+        response = await _get("/large", accept_encoding="identity")
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == '"abc"'
+
+    async def test_streams_compressed_chunks(self):
+        response = await _get("/stream")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        lines = response.text.splitlines()
+        assert len(lines) == 50
+        assert lines[0].startswith('{"row": 0')
+
+
+class TestNegotiateEncoding:
+    def test_respects_zero_quality(self):
+        assert negotiate_encoding("gzip;q=0") is None
+
+    def test_wildcard(self):
+        assert negotiate_encoding("*") is not None
+
+    def test_gzip_available(self):
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+
+
+def test_gzip_stream_is_decodable_per_flush():
+    # Each sync-flushed chunk must be decodable on its own prefix — that's what
+    # lets a streaming client consume rows before the response ends.
+    encoder = GzipEncoder()
+    first = encoder.compress(b"hello ") + encoder.flush()
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decoder.decompress(first) == b"hello "
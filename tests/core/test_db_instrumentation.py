@@ -0,0 +1,76 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db.instrumentation import (
+    InstrumentedAsyncPool,
+    QueryBudgetExceeded,
+    QueryStats,
+    check_query_budget,
+    instrument_engine,
+    pool_status,
+    start_query_stats,
+    stop_query_stats,
+)
+
+
+class TestDbInstrumentation:
+    async def test_records_queries_and_slow_statements(self):
+        engine = instrument_engine(create_async_engine(os.environ["DATABASE_URL"], poolclass=InstrumentedAsyncPool))
+        stats = start_query_stats()
+
+        try:
+            with (
+                patch("app.core.db.instrumentation.database_config.DB_SLOW_QUERY_MS", 0),
+                patch("app.core.db.instrumentation.log") as log,
+            ):
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                    assert pool_status(engine.pool)["pool_in_use"] == 1
+        finally:
+            stop_query_stats()
+            await engine.dispose()
+
+        assert stats.queries >= 1
+        assert stats.duration > 0
+        assert stats.pool_wait > 0
+        slow = [call for call in log.warning.call_args_list if call.args == ("db_query_slow",)]
+        assert any(call.kwargs["statement"] == "SELECT 1" for call in slow)
+
+    async def test_raise_mode_fails_on_repeated_statement_shape(self):
+        engine = instrument_engine(create_async_engine(os.environ["DATABASE_URL"], poolclass=InstrumentedAsyncPool))
+        stats = start_query_stats()
+
+        try:
+            with (
+                patch("app.core.db.instrumentation.database_config.DB_QUERY_BUDGET_MODE", "raise"),
+                patch("app.core.db.instrumentation.database_config.DB_REPEATED_STATEMENT_LIMIT", 2),
+            ):
+                async with engine.connect() as conn:
+                    for n in range(2):
+                        await conn.execute(text("SELECT :n"), {"n": n})
+                    with pytest.raises(QueryBudgetExceeded, match="SELECT"):
+                        await conn.execute(text("SELECT :n"), {"n": 2})
+        finally:
+            stop_query_stats()
+            await engine.dispose()
+
+        assert stats.shapes.most_common(1)[0][1] == 3
+
+    def test_warn_mode_reports_repeated_shapes(self):
+        stats = QueryStats(queries=40)
+        stats.shapes["SELECT items.id FROM items WHERE items.id = %(id)s"] = 40
+
+        with (
+            patch("app.core.db.instrumentation.database_config.DB_QUERY_BUDGET_MODE", "warn"),
+            patch("app.core.db.instrumentation.log") as log,
+        ):
+            check_query_budget(stats, scope="GET /api/v1/items")
+
+        log.warning.assert_called_once()
+        assert log.warning.call_args.kwargs["repeated_statements"] == [
+            ("SELECT items.id FROM items WHERE items.id = %(id)s", 40)
+        ]
@@ -0,0 +1,12 @@
+from app.core.etag import etag_matches, make_etag
+
+
+def test_etag_matching_uses_weak_comparison():
+    etag = make_etag("item", 1)
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
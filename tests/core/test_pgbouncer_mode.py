@@ -0,0 +1,57 @@
+import os
+from unittest.mock import patch
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db.base import engine_options
+from app.core.db.instrumentation import InstrumentedAsyncPool, InstrumentedNullPool, instrument_engine
+from app.core.db.replicas import ReplicaSet
+
+
+class TestPgBouncerMode:
+    def test_default_mode_pools_in_process(self):
+        options = engine_options()
+
+        assert options["poolclass"] is InstrumentedAsyncPool
+        assert "connect_args" not in options
+
+    def test_transaction_mode_leaves_pooling_to_pgbouncer(self):
+        with patch("app.core.db.base.database_config.DB_PGBOUNCER_TRANSACTION_MODE", True):
+            options = engine_options()
+
+        assert options["poolclass"] is InstrumentedNullPool
+        assert options["connect_args"] == {"prepare_threshold": None}
+        assert "pool_size" not in options
+
+    async def test_transaction_mode_never_prepares_statements(self):
+        with patch("app.core.db.base.database_config.DB_PGBOUNCER_TRANSACTION_MODE", True):
+            engine = instrument_engine(create_async_engine(os.environ["DATABASE_URL"], **engine_options()))
+
+        try:
+            async with engine.connect() as conn:
+                # psycopg prepares a statement after 5 executions by default.
+                for n in range(10):
+                    await conn.execute(text("SELECT :n"), {"n": n})
+                prepared = (await conn.execute(text("SELECT count(*) FROM pg_prepared_statements"))).scalar_one()
+        finally:
+            await engine.dispose()
+
+        assert prepared == 0
+
+    async def test_least_busy_spreads_reads_across_replicas(self):
+        with patch("app.core.db.base.database_config.DB_PGBOUNCER_TRANSACTION_MODE", True):
+            replicas = ReplicaSet.from_urls([os.environ["DATABASE_URL"]] * 2, selection="least_busy")
+        first, second = replicas.engines
+
+        try:
+            # NullPool keeps no connections: idle replicas take turns.
+            assert {replicas.pick() for _ in range(4)} == {first, second}
+            async with first.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                assert replicas.in_use(first) == 1
+                assert [replicas.pick() for _ in range(3)] == [second] * 3
+            assert replicas.in_use(first) == 0
+        finally:
+            for engine in replicas.engines:
+                await engine.dispose()
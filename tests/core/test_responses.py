@@ -0,0 +1,26 @@
+import uuid
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.responses import APIResponse, api_response
+
+
+class _Payload(BaseModel):
+    id: uuid.UUID
+    name: str
+    note: str | None
+
+
+def test_api_response_matches_response_model_encoding():
+    # The fast path must put the same bytes on the wire as FastAPI's
+    # validate → dump(mode="json") → JSONResponse path.
+    data = {"id": uuid.uuid4(), "name": 'zażółć "gęślą"', "note": None}
+    adapter = TypeAdapter(APIResponse[_Payload])
+    expected = JSONResponse(adapter.dump_python(adapter.validate_python({"data": data}), mode="json")).body
+
+    assert api_response({"data": data}).body == expected
+
+
+def test_api_response_always_emits_full_envelope():
+    assert api_response({"message": "api.general.success"}).body == b'{"message":"api.general.success","data":null}'
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_load(self):
+        flight = SingleFlight[str, int]("test")
+        loads = 0
+        release = asyncio.Event()
+
+        async def load() -> int:
+            nonlocal loads
+            loads += 1
+            await release.wait()
+            return 42
+
+        callers = [asyncio.create_task(flight.do("key", load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*callers) == [42] * 5
+        assert loads == 1
+        assert (flight.stats.calls, flight.stats.executed, flight.stats.coalesced) == (5, 1, 4)
+        assert flight.in_flight == 0
+
+    async def test_sequential_calls_load_again(self):
+        flight = SingleFlight[str, int]("test")
+
+        async def load() -> int:
+            return 1
+
+        await flight.do("key", load)
+        await flight.do("key", load)
+
+        assert flight.stats.executed == 2
+
+    async def test_errors_reach_every_waiter(self):
+        flight = SingleFlight[str, int]("test")
+
+        async def load() -> int:
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.do("key", load) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.stats.executed == 1
+
+    async def test_follower_takes_over_when_leader_is_cancelled(self):
+        flight = SingleFlight[str, str]("test")
+        started = asyncio.Event()
+
+        async def slow() -> str:
+            started.set()
+            await asyncio.sleep(10)
+            return "leader"
+
+        async def fast() -> str:
+            return "follower"
+
+        leader = asyncio.create_task(flight.do("key", slow))
+        await started.wait()
+        follower = asyncio.create_task(flight.do("key", fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await follower == "follower"
+        assert flight.stats.executed == 2
@@ -0,0 +1,25 @@
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.items.service.batch_get import BatchGetItemsService
+from tests.factories.item import ItemFactory
+
+
+class TestBatchGetItemsService:
+    async def test_returns_items_in_request_order(self, db_session: AsyncSession):
+        first, second, third = [await ItemFactory.create() for _ in range(3)]
+
+        result = await BatchGetItemsService(db=db_session).call(item_ids=[third.id, first.id, second.id, third.id])
+
+        assert [item["id"] for item in result["data"]["items"]] == [third.id, first.id, second.id]
+        assert result["data"]["missing_ids"] == []
+
+    async def test_reports_missing_ids(self, db_session: AsyncSession):
+        item = await ItemFactory.create()
+        missing = uuid.uuid4()
+
+        result = await BatchGetItemsService(db=db_session).call(item_ids=[missing, item.id])
+
+        assert [found["id"] for found in result["data"]["items"]] == [item.id]
+        assert result["data"]["missing_ids"] == [missing]
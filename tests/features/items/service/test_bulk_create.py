@@ -0,0 +1,17 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.items.service.bulk_create import BulkCreateItemsService
+from app.repositories.items.models import Item
+
+
+class TestBulkCreateItemsService:
+    async def test_bulk_create_returns_rows_in_input_order(self, db_session: AsyncSession):
+        payload = [{"name": f"Bulk {n}", "description": None} for n in range(3)]
+
+        result = await BulkCreateItemsService(db=db_session).call(items=payload)
+
+        items = result["data"]["items"]
+        assert [item["name"] for item in items] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+        assert all(item["status"] == "active" and item["id"] is not None for item in items)
+        assert (await db_session.execute(select(func.count()).select_from(Item))).scalar_one() == 3
@@ -0,0 +1,45 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.items.service.cleanup import CleanupItemsService
+from app.utils.time import utc_now
+from tests.factories.item import ItemFactory
+
+
+class TestCleanupItemsService:
+    async def test_archives_stale_items_in_chunks(self, db_session: AsyncSession):
+        long_ago = utc_now() - timedelta(days=400)
+        stale = [await ItemFactory.create(created_at=long_ago, updated_at=long_ago) for _ in range(3)]
+        fresh = await ItemFactory.create()
+
+        with (
+            patch("app.features.items.service.cleanup.database_config.ITEMS_ARCHIVE_CHUNK_SIZE", 2),
+            patch("app.features.items.service.cleanup.async_redis", AsyncMock(get=AsyncMock(return_value=None))),
+            patch("app.features.items.service.cleanup.item_cache.invalidate_items", AsyncMock()) as invalidate,
+        ):
+            result = await CleanupItemsService(db=db_session).call()
+
+        assert result["archived"] == 3
+        assert {item_id for call in invalidate.await_args_list for item_id in call.args} == {item.id for item in stale}
+        assert result["chunks"] == 2
+        assert result["complete"] is True
+        for item in stale:
+            await db_session.refresh(item)
+            assert item.status == "archived"
+        await db_session.refresh(fresh)
+        assert fresh.status == "active"
+
+    async def test_stops_at_the_time_budget(self, db_session: AsyncSession):
+        long_ago = utc_now() - timedelta(days=400)
+        await ItemFactory.create(created_at=long_ago, updated_at=long_ago)
+
+        with (
+            patch("app.features.items.service.cleanup.database_config.ITEMS_ARCHIVE_TIME_BUDGET_SECONDS", 0),
+            patch("app.features.items.service.cleanup.async_redis", AsyncMock(get=AsyncMock(return_value=None))),
+        ):
+            result = await CleanupItemsService(db=db_session).call()
+
+        assert result["archived"] == 0
+        assert result["complete"] is False
@@ -0,0 +1,34 @@
+import csv
+import io
+import json
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.items.service.export import ExportItemsService
+from app.features.items.service.helpers import ITEM_FIELDS
+from tests.factories.item import ItemFactory
+
+
+class TestExportItemsService:
+    async def test_export_ndjson_streams_every_row_oldest_first(self, db_session: AsyncSession):
+        created = [await ItemFactory.create() for _ in range(3)]
+
+        chunks = [chunk async for chunk in ExportItemsService(db=db_session).call(export_format="ndjson")]
+
+        rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+        assert [row["id"] for row in rows] == [str(item.id) for item in created]
+        assert list(rows[0]) == list(ITEM_FIELDS)
+
+    async def test_export_csv_has_header_and_filters_by_status(self, db_session: AsyncSession):
+        await ItemFactory.create(status="active")
+        archived = await ItemFactory.create(status="archived", summary=None)
+
+        chunks = [
+            chunk async for chunk in ExportItemsService(db=db_session).call(export_format="csv", status="archived")
+        ]
+
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert rows[0] == list(ITEM_FIELDS)
+        assert len(rows) == 2
+        assert rows[1][0] == str(archived.id)
+        assert rows[1][ITEM_FIELDS.index("summary")] == ""
@@ -16,9 +16,40 @@ class TestListItemsService:
         assert data["total_pages"] == 2
         assert len(data["items"]) == 2
 
+    async def test_list_without_total(self, db_session: AsyncSession):
+        for _ in range(3):
+            await ItemFactory.create()
+
+        result = await ListItemsService(db=db_session).call(page=1, page_size=2, include_total=False)
+
+        data = result["data"]
+        assert data["total_count"] is None
+        assert data["total_pages"] is None
+        assert data["next_cursor"] is not None
+
     async def test_list_empty(self, db_session: AsyncSession):
         result = await ListItemsService(db=db_session).call(page=1, page_size=10)
 
         assert result["data"]["total_count"] == 0
         assert result["data"]["total_pages"] == 0
         assert result["data"]["items"] == []
+
+    async def test_list_follows_cursor_to_the_end(self, db_session: AsyncSession):
+        created = [await ItemFactory.create() for _ in range(5)]
+        service = ListItemsService(db=db_session)
+
+        first = (await service.call(page=1, page_size=2))["data"]
+        second = (await service.call(page=1, page_size=2, cursor=first["next_cursor"]))["data"]
+        third = (await service.call(page=1, page_size=2, cursor=second["next_cursor"]))["data"]
+
+        seen = [item["id"] for page in (first, second, third) for item in page["items"]]
+        assert seen == [item.id for item in reversed(created)]
+        assert second["page"] is None
+        assert third["next_cursor"] is None
+
+    async def test_list_returns_only_requested_fields(self, db_session: AsyncSession):
+        await ItemFactory.create()
+
+        result = await ListItemsService(db=db_session).call(page=1, page_size=10, fields=("id", "name"))
+
+        assert list(result["data"]["items"][0]) == ["id", "name"]
@@ -0,0 +1,93 @@
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.items.service.partitions import MaintainItemPartitionsService
+from app.repositories.items import crud, partitions
+from tests.factories.item import ItemFactory
+
+
+class TestMaintainItemPartitionsService:
+    async def test_creates_upcoming_months(self, db_session: AsyncSession):
+        with patch("app.features.items.service.partitions.database_config.ITEMS_PARTITION_PREMAKE_MONTHS", 2):
+            result = await MaintainItemPartitionsService(db=db_session).call(today=date(2031, 11, 20))
+
+        assert result["ensured"] == ["items_p2031_11", "items_p2031_12", "items_p2032_01"]
+        names = [partition.name for partition in await partitions.list_item_partitions(db_session)]
+        assert {"items_p2031_11", "items_p2031_12", "items_p2032_01"} <= set(names)
+
+    async def test_moves_rows_out_of_the_default_partition(self, db_session: AsyncSession):
+        # Created while no 2031-11 partition exists, so the row lands in items_default.
+        stranded = await ItemFactory.create(created_at=datetime(2031, 11, 15, tzinfo=UTC), status="archived")
+        before = await crud.count_items(db_session, status="archived")
+
+        result = await MaintainItemPartitionsService(db=db_session).call(today=date(2031, 11, 20))
+
+        assert "items_p2031_11" in result["ensured"]
+        partition = await db_session.scalar(
+            text("SELECT tableoid::regclass::text FROM public.items WHERE id = :id"), {"id": stranded.id}
+        )
+        assert partition == "items_p2031_11"
+        assert await crud.count_items(db_session, status="archived") == before
+
+    async def test_drops_expired_partitions_and_keeps_counts_exact(self, db_session: AsyncSession):
+        await partitions.ensure_item_partitions(db_session, [date(2020, 1, 1)])
+        expired = await ItemFactory.create(created_at=datetime(2020, 1, 15, tzinfo=UTC), status="archived")
+        kept = await ItemFactory.create(status="archived")
+
+        with (
+            patch("app.features.items.service.partitions.database_config.ITEMS_RETENTION_MONTHS", 12),
+            patch("app.features.items.service.partitions.database_config.ITEMS_RETENTION_ACTION", "drop"),
+            patch("app.features.items.service.partitions.item_cache.invalidate_items", AsyncMock()) as invalidate,
+        ):
+            result = await MaintainItemPartitionsService(db=db_session).call()
+
+        remaining = [partition.name for partition in await partitions.list_item_partitions(db_session)]
+        assert "items_p2020_01" in result["retired"]
+        assert "items_p2020_01" not in remaining
+        assert await crud.count_items(db_session, status="archived") == 1
+        assert await crud.get_item_by_id(db_session, kept.id) is not None
+        invalidate.assert_awaited_once_with(expired.id)
+
+    async def test_keeps_everything_without_retention(self, db_session: AsyncSession):
+        await partitions.ensure_item_partitions(db_session, [date(2020, 1, 1)])
+
+        result = await MaintainItemPartitionsService(db=db_session).call()
+
+        assert result["retired"] == []
+
+    async def test_finishes_a_retirement_cut_short_after_the_detach(self, db_session: AsyncSession):
+        await partitions.ensure_item_partitions(db_session, [date(2020, 1, 1)])
+        expired = await ItemFactory.create(created_at=datetime(2020, 1, 15, tzinfo=UTC))
+        # A previous run detached the partition, then died before invalidating and dropping it.
+        [partition] = [p for p in await partitions.list_item_partitions(db_session) if p.name == "items_p2020_01"]
+        await partitions.detach_item_partition(db_session, partition, lock_timeout_ms=2000)
+
+        with (
+            patch("app.features.items.service.partitions.database_config.ITEMS_RETENTION_MONTHS", 12),
+            patch("app.features.items.service.partitions.database_config.ITEMS_RETENTION_ACTION", "drop"),
+            patch("app.features.items.service.partitions.item_cache.invalidate_items", AsyncMock()) as invalidate,
+        ):
+            result = await MaintainItemPartitionsService(db=db_session).call()
+
+        assert "items_p2020_01" in result["retired"]
+        assert await db_session.scalar(text("SELECT to_regclass('public.items_p2020_01')")) is None
+        invalidate.assert_awaited_once_with(expired.id)
+
+    async def test_kept_partitions_are_retired_once(self, db_session: AsyncSession):
+        await partitions.ensure_item_partitions(db_session, [date(2020, 1, 1)])
+        await ItemFactory.create(created_at=datetime(2020, 1, 15, tzinfo=UTC))
+
+        with (
+            patch("app.features.items.service.partitions.database_config.ITEMS_RETENTION_MONTHS", 12),
+            patch("app.features.items.service.partitions.item_cache.invalidate_items", AsyncMock()) as invalidate,
+        ):
+            first = await MaintainItemPartitionsService(db=db_session).call()
+            second = await MaintainItemPartitionsService(db=db_session).call()
+
+        assert "items_p2020_01" in first["retired"]
+        assert second["retired"] == []
+        assert await db_session.scalar(text("SELECT to_regclass('public.items_p2020_01')")) is not None
+        invalidate.assert_awaited_once()
@@ -0,0 +1,31 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.items.service.search import SearchItemsService
+from tests.factories.item import ItemFactory
+
+
+class TestSearchItemsService:
+    async def test_search_ranks_name_matches_first(self, db_session: AsyncSession):
+        in_summary = await ItemFactory.create(name="Widget", description=None, summary="a rusty gearbox")
+        in_name = await ItemFactory.create(name="Gearbox", description=None, summary=None)
+        await ItemFactory.create(name="Sprocket", description="unrelated", summary=None)
+
+        result = await SearchItemsService(db=db_session).call(query="gearboxes", page_size=10)
+
+        assert [item["id"] for item in result["data"]["items"]] == [in_name.id, in_summary.id]
+        assert result["data"]["next_cursor"] is None
+
+    async def test_search_follows_cursor(self, db_session: AsyncSession):
+        created = [await ItemFactory.create(name=f"Lamp {i}", description=None, summary=None) for i in range(5)]
+        service = SearchItemsService(db=db_session)
+
+        seen = []
+        cursor = None
+        for _ in range(3):
+            data = (await service.call(query="lamp", page_size=2, cursor=cursor))["data"]
+            seen += [item["id"] for item in data["items"]]
+            cursor = data["next_cursor"]
+
+        assert cursor is None
+        assert sorted(seen) == sorted(item.id for item in created)
+        assert len(seen) == len(set(seen))
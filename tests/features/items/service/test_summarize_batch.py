@@ -0,0 +1,52 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.items.service.summarize_batch import SummarizeItemsService
+from tests.factories.item import ItemFactory
+
+
+class TestSummarizeItemsService:
+    async def test_summarizes_pending_items_and_skips_the_rest(self, db_session: AsyncSession):
+        pending = await ItemFactory.create(description="long text", summary=None)
+        done = await ItemFactory.create(description="long text", summary="already")
+        empty = await ItemFactory.create(description=None, summary=None)
+
+        async def fake_summarize(text: str):
+            return SimpleNamespace(summary=f"summary of {text}")
+
+        with patch("app.features.items.service.summarize_batch.summarize_text", fake_summarize):
+            result = await SummarizeItemsService(db=db_session).call([str(pending.id), str(done.id), str(empty.id)])
+
+        assert result == {"summarized": [str(pending.id)], "skipped": [str(done.id), str(empty.id)], "failed": []}
+        # The bulk UPDATE skips session synchronization; reload what it wrote.
+        await db_session.refresh(pending)
+        assert pending.summary == "summary of long text"
+        await db_session.refresh(done)
+        assert done.summary == "already"
+
+    async def test_bounds_concurrency_and_reports_failures(self, db_session: AsyncSession):
+        items = [await ItemFactory.create(description=f"text {n}", summary=None) for n in range(6)]
+        running = peak = 0
+
+        async def fake_summarize(text: str):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if text == "text 0":
+                raise RuntimeError("bedrock throttled")
+            return SimpleNamespace(summary=text.upper())
+
+        with (
+            patch("app.features.items.service.summarize_batch.summarize_text", fake_summarize),
+            patch("app.features.items.service.summarize_batch.ai_config.AI_BATCH_CONCURRENCY", 2),
+        ):
+            result = await SummarizeItemsService(db=db_session).call([str(item.id) for item in items])
+
+        assert peak == 2
+        assert result["failed"] == [str(items[0].id)]
+        assert len(result["summarized"]) == 5
@@ -1,3 +1,5 @@
+import uuid
+
 from httpx import AsyncClient
 
 from tests.factories.item import ItemFactory
@@ -11,12 +13,134 @@ class TestItemRoutes:
         body = resp.json()
         assert body["data"]["name"] == "Gadget"
 
+    async def test_bulk_create_items(self, client: AsyncClient):
+        resp = await client.post("/api/v1/items/bulk", json={"items": [{"name": "One"}, {"name": "Two"}]})
+
+        assert resp.status_code == 201
+        assert [item["name"] for item in resp.json()["data"]["items"]] == ["One", "Two"]
+
+    async def test_reports_db_query_count_header(self, client: AsyncClient):
+        await ItemFactory.create()
+
+        resp = await client.get("/api/v1/items")
+
+        assert resp.status_code == 200
+        assert int(resp.headers["x-db-query-count"]) >= 1
+
+    async def test_bulk_create_rejects_empty_payload(self, client: AsyncClient):
+        resp = await client.post("/api/v1/items/bulk", json={"items": []})
+
+        assert resp.status_code == 422
+
+    async def test_list_items_sparse_fields(self, client: AsyncClient):
+        await ItemFactory.create()
+
+        resp = await client.get("/api/v1/items", params={"fields": "status,name"})
+
+        assert resp.status_code == 200
+        assert list(resp.json()["data"]["items"][0]) == ["id", "name", "status"]
+
+    async def test_list_items_rejects_unknown_fields(self, client: AsyncClient):
+        resp = await client.get("/api/v1/items", params={"fields": "name,secret"})
+
+        assert resp.status_code == 400
+
+    async def test_batch_get_items(self, client: AsyncClient):
+        item = await ItemFactory.create()
+
+        resp = await client.post("/api/v1/items:batchGet", json={"ids": [str(item.id)]})
+
+        assert resp.status_code == 200
+        assert resp.json()["data"]["items"][0]["id"] == str(item.id)
+
+    async def test_batch_get_rejects_too_many_ids(self, client: AsyncClient):
+        resp = await client.post("/api/v1/items:batchGet", json={"ids": [str(uuid.uuid4()) for _ in range(101)]})
+
+        assert resp.status_code == 422
+
+    async def test_export_items_streams_ndjson(self, client: AsyncClient):
+        item = await ItemFactory.create()
+
+        resp = await client.get("/api/v1/items/export")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        assert str(item.id) in resp.text
+
+    async def test_search_items(self, client: AsyncClient):
+        item = await ItemFactory.create(name="Searchable teapot")
+
+        resp = await client.get("/api/v1/items/search", params={"q": "teapot"})
+
+        assert resp.status_code == 200
+        assert [found["id"] for found in resp.json()["data"]["items"]] == [str(item.id)]
+
+    async def test_search_requires_query(self, client: AsyncClient):
+        resp = await client.get("/api/v1/items/search")
+
+        assert resp.status_code == 422
+
+    async def test_get_item_revalidates_with_etag(self, client: AsyncClient):
+        item = await ItemFactory.create()
+
+        first = await client.get(f"/api/v1/items/{item.id}")
+        etag = first.headers["etag"]
+        second = await client.get(f"/api/v1/items/{item.id}", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert first.json()["data"]["id"] == str(item.id)
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    async def test_get_item_etag_changes_after_update(self, client: AsyncClient, db_session):
+        item = await ItemFactory.create(summary=None)
+        etag = (await client.get(f"/api/v1/items/{item.id}")).headers["etag"]
+
+        item.summary = "now summarized"
+        await db_session.flush()
+        resp = await client.get(f"/api/v1/items/{item.id}", headers={"If-None-Match": etag})
+
+        assert resp.status_code == 200
+        assert resp.json()["data"]["summary"] == "now summarized"
+
+    async def test_list_items_weak_etag(self, client: AsyncClient):
+        await ItemFactory.create()
+
+        first = await client.get("/api/v1/items")
+        second = await client.get("/api/v1/items", headers={"If-None-Match": first.headers["etag"]})
+
+        assert first.headers["etag"].startswith('W/"')
+        assert second.status_code == 304
+
     async def test_get_item_not_found(self, client: AsyncClient):
         resp = await client.get("/api/v1/items/00000000-0000-0000-0000-000000000000")
 
         assert resp.status_code == 404
         assert resp.json()["error"] == "item_not_found"
 
+    async def test_list_items_filters_by_status(self, client: AsyncClient):
+        await ItemFactory.create(status="active")
+        archived = await ItemFactory.create(status="archived")
+
+        resp = await client.get("/api/v1/items", params={"status": "archived"})
+
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        assert [item["id"] for item in data["items"]] == [str(archived.id)]
+        assert data["total_count"] == 1
+
+    async def test_list_items_rejects_unknown_status(self, client: AsyncClient):
+        resp = await client.get("/api/v1/items", params={"status": "deleted"})
+
+        assert resp.status_code == 422
+
+    async def test_list_items_rejects_malformed_cursor(self, client: AsyncClient):
+        resp = await client.get("/api/v1/items", params={"cursor": "not-a-cursor"})
+
+        assert resp.status_code == 400
+        assert resp.json()["error"] == "invalid_cursor"
+
     async def test_summarize_enqueues_task(self, client: AsyncClient, mock_celery):
         item = await ItemFactory.create()
 
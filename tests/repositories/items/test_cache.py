@@ -0,0 +1,58 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.items import crud
+from app.repositories.items.cache import dump_item, load_item
+from tests.factories.item import ItemFactory
+
+
+class TestItemCache:
+    async def test_dump_and_load_round_trip(self, db_session: AsyncSession):
+        item = await ItemFactory.create(description="cached", summary=None)
+
+        restored = load_item(dump_item(item))
+
+        assert restored.id == item.id
+        assert restored.description == "cached"
+        assert restored.summary is None
+        assert restored.created_at == item.created_at
+        assert restored.updated_at == item.updated_at
+
+    async def test_read_through_falls_back_to_database(self, db_session: AsyncSession):
+        item = await ItemFactory.create()
+
+        found = await crud.get_item_by_id_cached(db_session, item.id)
+
+        assert found is not None
+        assert found.id == item.id
+
+    async def test_replica_miss_fills_the_cache_from_the_primary(self, db_session: AsyncSession):
+        item = await ItemFactory.create()
+        replica = MagicMock()  # never queried: the miss loads through the primary
+
+        with (
+            patch("app.repositories.items.crud.cache_config.CACHE_ENABLED", True),
+            patch("app.repositories.items.crud.primary_session", return_value=db_session),
+            patch("app.repositories.items.crud.item_cache.get_cached_item", AsyncMock(return_value=None)),
+            patch("app.repositories.items.crud.item_cache.cache_item", AsyncMock()) as fill,
+        ):
+            found = await crud.get_item_by_id_cached(replica, item.id)
+
+        assert found is not None
+        assert found.id == item.id
+        fill.assert_awaited_once()
+
+    async def test_replica_read_without_a_primary_is_not_cached(self, db_session: AsyncSession):
+        item = await ItemFactory.create()
+
+        with (
+            patch("app.repositories.items.crud.cache_config.CACHE_ENABLED", True),
+            patch("app.repositories.items.crud.primary_session", return_value=None),
+            patch("app.repositories.items.crud.item_cache.get_cached_item", AsyncMock(return_value=None)),
+            patch("app.repositories.items.crud.item_cache.cache_item", AsyncMock()) as fill,
+        ):
+            found = await crud.get_item_by_id_cached(db_session, item.id)
+
+        assert found is not None
+        fill.assert_not_awaited()
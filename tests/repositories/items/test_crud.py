@@ -20,11 +20,33 @@ class TestItemCrud:
 
         assert item.summary == "the summary"
 
-    async def test_list_filters_by_status(self, db_session: AsyncSession):
+    async def test_list_item_rows_filters_by_status(self, db_session: AsyncSession):
         await ItemFactory.create(status="active")
         await ItemFactory.create(status="archived")
 
-        items, total = await crud.list_items_with_count(db_session, limit=10, offset=0, status="archived")
+        rows = await crud.list_item_rows(db_session, columns=("status",), limit=10, status="archived")
 
-        assert total == 1
-        assert items[0].status == "archived"
+        assert [row.status for row in rows] == ["archived"]
+
+    async def test_count_items_tracks_inserts_status_changes_and_deletes(self, db_session: AsyncSession):
+        first = await ItemFactory.create(status="active")
+        await ItemFactory.create(status="active")
+
+        first.status = "archived"
+        await db_session.flush()
+        assert await crud.count_items(db_session, status="active") == 1
+        assert await crud.count_items(db_session, status="archived") == 1
+
+        await db_session.delete(first)
+        await db_session.flush()
+        assert await crud.count_items(db_session) == 1
+
+    async def test_list_item_rows_returns_plain_rows(self, db_session: AsyncSession):
+        older = await ItemFactory.create()
+        newer = await ItemFactory.create()
+
+        rows = await crud.list_item_rows(db_session, columns=("id", "name"), limit=10)
+        after = await crud.list_item_rows(db_session, columns=("id",), limit=10, after=(newer.created_at, newer.id))
+
+        assert [tuple(row) for row in rows] == [(newer.id, newer.name), (older.id, older.name)]
+        assert [row.id for row in after] == [older.id]
@@ -0,0 +1,48 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.workers import idempotency
+from app.workers.idempotency import Claim, check_deliveries, claim_deliveries
+
+
+def _redis_with_pipeline(replies: list) -> tuple[MagicMock, MagicMock]:
+    pipe = MagicMock(execute=AsyncMock(return_value=replies))
+    redis = MagicMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    return redis, pipe
+
+
+class TestClaimDeliveries:
+    async def test_claims_a_batch_in_one_pipeline(self):
+        redis, pipe = _redis_with_pipeline([True, None])
+
+        with patch("app.workers.idempotency.async_redis", redis):
+            claims = await claim_deliveries("email", ["a", "b", "a"])
+
+        assert set(claims) == {"a", "b"}
+        assert isinstance(claims["a"], Claim)
+        assert claims["b"] is None  # delivered or claimed elsewhere
+        assert pipe.set.call_count == 2
+        assert pipe.set.call_args_list[0].kwargs == {"nx": True, "ex": idempotency.CLAIM_LEASE_SECONDS}
+        pipe.execute.assert_awaited_once()
+
+    async def test_anything_but_a_live_claim_counts_as_delivered(self):
+        redis = MagicMock(mget=AsyncMock(return_value=["done", "claimed:abc", None, "1"]))
+
+        with patch("app.workers.idempotency.async_redis", redis):
+            delivered = await check_deliveries("email", ["a", "b", "c", "d"])
+
+        assert delivered == {"a": True, "b": False, "c": False, "d": True}
+
+
+class TestBloomOffsets:
+    def test_offsets_are_stable_and_in_range(self):
+        with (
+            patch("app.workers.idempotency.celery_config.IDEMPOTENCY_BLOOM_BITS", 1024),
+            patch("app.workers.idempotency.celery_config.IDEMPOTENCY_BLOOM_HASHES", 7),
+        ):
+            offsets = idempotency._bloom_offsets("email", "a")
+
+            assert offsets == idempotency._bloom_offsets("email", "a")
+            assert offsets != idempotency._bloom_offsets("email", "b")
+        assert len(offsets) == 7
+        assert all(0 <= offset < 1024 for offset in offsets)
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.workers.publisher import TaskPublisher, TaskQueueFull, publisher_stats, task_publisher
+
+
+def _task(name: str = "tasks.example") -> MagicMock:
+    task = MagicMock()
+    task.name = name
+    return task
+
+
+@pytest.fixture
+def app() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def publisher(app: MagicMock):
+    publisher = TaskPublisher(app)
+    yield publisher
+    publisher.stop()
+
+
+class TestTaskPublisher:
+    async def test_publishes_in_micro_batches_off_the_event_loop(self, publisher: TaskPublisher, app: MagicMock):
+        task = _task()
+        threads: list[str] = []
+        task.apply_async.side_effect = lambda *args, **kwargs: threads.append(threading.current_thread().name)
+
+        with patch("app.workers.publisher.celery_config.TASK_PUBLISH_LINGER_MS", 50):
+            publisher.start()
+            for n in range(5):
+                await publisher.publish(task, n)
+            await asyncio.to_thread(publisher.stop)
+
+        assert [call.args[0] for call in task.apply_async.call_args_list] == [(n,) for n in range(5)]
+        assert set(threads) == {"task-publisher"}
+        assert publisher.stats.published == 5
+        assert publisher.stats.batches == 1
+        assert app.connection_for_write.call_count == 1
+
+    async def test_rejects_when_the_buffer_stays_full(self, publisher: TaskPublisher):
+        task = _task()
+        broker_down = threading.Event()
+        task.apply_async.side_effect = lambda *args, **kwargs: broker_down.wait(5)
+
+        with (
+            patch("app.workers.publisher.celery_config.TASK_PUBLISH_CAPACITY", 1),
+            patch("app.workers.publisher.celery_config.TASK_ENQUEUE_TIMEOUT_SECONDS", 0.05),
+        ):
+            publisher.start()
+            await publisher.publish(task, 1)
+            with pytest.raises(TaskQueueFull):
+                await publisher.publish(task, 2)
+            broker_down.set()
+
+        assert publisher.stats.rejected == 1
+
+    async def test_failed_publish_is_retried_on_a_fresh_connection(self, publisher: TaskPublisher, app: MagicMock):
+        task = _task()
+        task.apply_async.side_effect = [ConnectionError("broker gone"), None]
+
+        publisher.start()
+        await publisher.publish(task, 1)
+        await asyncio.to_thread(publisher.stop)
+
+        assert [call.args[0] for call in task.apply_async.call_args_list] == [(1,), (1,)]
+        assert publisher.stats.failed == 1
+        assert publisher.stats.retried == 1
+        assert publisher.stats.published == 1
+        assert publisher.stats.dropped == 0
+        assert app.connection_for_write.call_count == 2
+
+    async def test_message_is_dropped_and_counted_after_its_retries(self, publisher: TaskPublisher, app: MagicMock):
+        task = _task()
+        task.apply_async.side_effect = ConnectionError("broker gone")
+
+        with patch("app.workers.publisher.celery_config.TASK_PUBLISH_RETRIES", 2):
+            publisher.start()
+            await publisher.publish(task, 1)
+            await asyncio.to_thread(publisher.stop)
+
+        assert task.apply_async.call_count == 3
+        assert publisher.stats.failed == 3
+        assert publisher.stats.retried == 2
+        assert publisher.stats.dropped == 1
+        assert publisher.stats.published == 0
+        assert app.connection_for_write.call_count == 3
+
+    async def test_falls_back_to_delay_when_not_started(self, publisher: TaskPublisher):
+        task = _task()
+
+        await publisher.publish(task, "item-id")
+
+        task.delay.assert_called_once_with("item-id")
+
+    def test_stats_are_exposed_for_the_app_publisher(self):
+        assert publisher_stats() is task_publisher.stats
@@ -0,0 +1,66 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import structlog
+from celery.exceptions import SoftTimeLimitExceeded
+
+from app.core.logger import bind_context, clear_context
+from app.workers.runner import run_async, start_shared_loop, stop_shared_loop
+
+
+@pytest.fixture
+def shared_loop():
+    start_shared_loop()
+    yield
+    stop_shared_loop()
+
+
+class TestSharedLoop:
+    def test_runs_tasks_concurrently_with_isolated_context(self, shared_loop):
+        running = peak = 0
+        all_started = asyncio.Event()
+
+        def task(n: int) -> str:
+            # What task_prerun does on each pool thread.
+            clear_context()
+            bind_context(task_id=f"task-{n}")
+
+            async def body() -> str:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                if running == 4:
+                    all_started.set()
+                # Only returns once all four are in flight together on the one loop.
+                await asyncio.wait_for(all_started.wait(), timeout=5)
+                running -= 1
+                return structlog.contextvars.get_contextvars()["task_id"]
+
+            return run_async(body())
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(task, range(4)))
+
+        assert results == ["task-0", "task-1", "task-2", "task-3"]
+        assert peak == 4
+
+    def test_soft_time_limit_cancels_the_coroutine(self, shared_loop):
+        cancelled = False
+
+        async def body() -> None:
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        with (
+            patch("app.workers.runner._time_limits", return_value=(5, 0.05)),
+            pytest.raises(SoftTimeLimitExceeded),
+        ):
+            run_async(body())
+
+        assert cancelled